@@ -18,6 +18,7 @@ class AnnotationManager:
 
     Attributes:
         _annotations: Dictionary mapping annotation IDs to Annotation objects
+        _by_image: Index mapping image IDs to their annotations (by annotation ID)
         _validation_enabled: Whether to validate annotations before creation
 
     Example:
@@ -36,6 +37,7 @@ class AnnotationManager:
             validation_enabled: Whether to validate annotations (default: True)
         """
         self._annotations: dict[str, Annotation] = {}
+        self._by_image: dict[str, dict[str, Annotation]] = {}
         self._validation_enabled = validation_enabled
 
     def create_annotation(
@@ -60,13 +62,14 @@ class AnnotationManager:
         Raises:
             ValueError: If validation fails
         """
+        now = datetime.now()
         annotation = Annotation(
             bounding_box=box,
             label_id=label_id,
             label_name=label_name,
             image_id=image_id,
-            created_at=datetime.now(),
-            modified_at=datetime.now()
+            created_at=now,
+            modified_at=now
         )
 
         if self._validation_enabled:
@@ -74,9 +77,21 @@ class AnnotationManager:
             if not is_valid:
                 raise ValueError(f"Invalid annotation: {error_msg}")
 
-        self._annotations[annotation.id] = annotation
+        self.add_annotation(annotation)
         return annotation
 
+    def add_annotation(self, annotation: Annotation) -> None:
+        """
+        Register an existing annotation (e.g. one loaded by an importer).
+
+        No validation is performed; annotation.image_id must already be set.
+
+        Args:
+            annotation: The annotation to register
+        """
+        self._annotations[annotation.id] = annotation
+        self._by_image.setdefault(annotation.image_id, {})[annotation.id] = annotation
+
     def get_annotation(self, annotation_id: str) -> Optional[Annotation]:
         """
         Get an annotation by ID.
@@ -164,10 +179,16 @@ class AnnotationManager:
         Returns:
             True if annotation was deleted, False if not found
         """
-        if annotation_id in self._annotations:
-            del self._annotations[annotation_id]
-            return True
-        return False
+        annotation = self._annotations.pop(annotation_id, None)
+        if annotation is None:
+            return False
+
+        image_annotations = self._by_image.get(annotation.image_id)
+        if image_annotations is not None:
+            image_annotations.pop(annotation_id, None)
+            if not image_annotations:
+                del self._by_image[annotation.image_id]
+        return True
 
     def get_annotations_for_image(self, image_id: str) -> list[Annotation]:
         """
@@ -179,10 +200,7 @@ class AnnotationManager:
         Returns:
             List of annotations for the image
         """
-        return [
-            ann for ann in self._annotations.values()
-            if ann.image_id == image_id
-        ]
+        return list(self._by_image.get(image_id, {}).values())
 
     def get_all_annotations(self) -> list[Annotation]:
         """
@@ -193,6 +211,15 @@ class AnnotationManager:
         """
         return list(self._annotations.values())
 
+    def get_annotation_count(self) -> int:
+        """
+        Get the total number of annotations across all images.
+
+        Returns:
+            Number of registered annotations
+        """
+        return len(self._annotations)
+
     def validate_annotation(self, annotation: Annotation) -> tuple[bool, str]:
         """
         Validate an annotation.
@@ -206,13 +233,15 @@ class AnnotationManager:
         if annotation.label_id <= 0:
             return False, "Label ID must be positive"
 
-        if not annotation.label_name or not annotation.label_name.strip():
+        label_name = annotation.label_name
+        if not label_name or not label_name.strip():
             return False, "Label name cannot be empty"
 
-        if not annotation.bounding_box:
+        box = annotation.bounding_box
+        if box is None:
             return False, "Bounding box is required"
 
-        if annotation.bounding_box.width <= 0 or annotation.bounding_box.height <= 0:
+        if box.width <= 0 or box.height <= 0:
             return False, "Bounding box must have positive width and height"
 
         return True, ""
@@ -236,7 +265,7 @@ class AnnotationManager:
 
         Note:
             Future implementation will:
-            1. Load the specified ML model (SAM/DINO)
+            1. Load the specified ML model (SAM/DINO), cached per model name
             2. Run inference on the image
             3. Convert model output to Annotation objects
             4. Return suggestions for user review
@@ -7,11 +7,17 @@ This module provides functionality to export annotations to various formats
 
 import csv
 import json
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator, Optional
 
-from core.models import ImageMetadata
+from core.models import Annotation, ImageMetadata
+
+try:
+    import orjson
+except ImportError:  # Optional dependency; fall back to stdlib json
+    orjson = None
 
 
 class ExportService:
@@ -27,10 +33,14 @@ class ExportService:
         >>> service.export_to_coco(images, "annotations.json")
     """
 
+    # Number of rows between progress callback invocations
+    PROGRESS_INTERVAL = 1000
+
     def export_to_csv(
         self,
         images: list[ImageMetadata],
-        output_path: str
+        output_path: str,
+        progress_callback: Optional[Callable[[int], None]] = None
     ) -> None:
         """
         Export annotations to CSV format.
@@ -41,6 +51,8 @@ class ExportService:
         Args:
             images: List of ImageMetadata objects with annotations
             output_path: Path to output CSV file
+            progress_callback: Optional callable receiving the number of rows
+                               written so far; invoked every PROGRESS_INTERVAL rows
 
         Raises:
             IOError: If file cannot be written
@@ -49,29 +61,52 @@ class ExportService:
         if not images:
             raise ValueError("No images to export")
 
-        # Collect all annotations from all images
-        rows = []
-        for image in images:
-            for annotation in image.annotations:
-                rows.append({
-                    'image_name': image.filename,
-                    'x': annotation.bounding_box.x,
-                    'y': annotation.bounding_box.y,
-                    'width': annotation.bounding_box.width,
-                    'height': annotation.bounding_box.height,
-                    'label_id': annotation.label_id,
-                    'label_name': annotation.label_name
-                })
-
-        if not rows:
+        if not any(image.annotations for image in images):
             raise ValueError("No annotations to export")
 
-        # Write to CSV
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        # Stream rows straight to disk instead of collecting them first
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             fieldnames = ['image_name', 'x', 'y', 'width', 'height', 'label_id', 'label_name']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(self._iter_csv_rows(images, progress_callback))
+
+    def _iter_csv_rows(
+        self,
+        images: list[ImageMetadata],
+        progress_callback: Optional[Callable[[int], None]] = None
+    ) -> Iterator[tuple]:
+        """
+        Yield one CSV row per annotation, in image order.
+
+        Args:
+            images: List of ImageMetadata objects with annotations
+            progress_callback: Optional callable receiving the number of rows
+                               yielded so far, throttled to PROGRESS_INTERVAL
+
+        Yields:
+            Tuples of (image_name, x, y, width, height, label_id, label_name)
+        """
+        row_count = 0
+        for image in images:
+            filename = image.filename
+            for annotation in image.annotations:
+                box = annotation.bounding_box
+                yield (
+                    filename,
+                    box.x,
+                    box.y,
+                    box.width,
+                    box.height,
+                    annotation.label_id,
+                    annotation.label_name
+                )
+                row_count += 1
+                if progress_callback is not None and row_count % self.PROGRESS_INTERVAL == 0:
+                    progress_callback(row_count)
+
+        if progress_callback is not None and row_count % self.PROGRESS_INTERVAL:
+            progress_callback(row_count)
 
     def export_to_coco(
         self,
@@ -109,84 +144,88 @@ class ExportService:
         if not images:
             raise ValueError("No images to export")
 
+        # Flatten (image index, annotation) pairs once for the passes below
+        pairs = [
+            (image_idx, annotation)
+            for image_idx, image in enumerate(images, start=1)
+            for annotation in image.annotations
+        ]
+
+        # Extract unique categories (label_id -> label_name); iterating in
+        # reverse keeps the first name seen for each ID
+        categories_map = {
+            annotation.label_id: annotation.label_name
+            for _, annotation in reversed(pairs)
+        }
+
         # Build COCO structure
+        # If use_relative_paths is True, use filename (may contain subdirs)
+        # Otherwise, extract just the basename from file_path
         coco_data = {
             "info": self._create_info_section(),
             "licenses": [],
-            "images": [],
-            "annotations": [],
-            "categories": []
+            "images": [
+                {
+                    "id": image_idx,
+                    "file_name": image.filename if use_relative_paths else Path(image.file_path).name,
+                    "width": image.width,
+                    "height": image.height,
+                    "date_captured": "",
+                    "license": 0,
+                    "coco_url": "",
+                    "flickr_url": ""
+                }
+                for image_idx, image in enumerate(images, start=1)
+            ],
+            "annotations": [
+                self._coco_annotation(annotation, annotation_id, image_idx)
+                for annotation_id, (image_idx, annotation) in enumerate(pairs, start=1)
+            ],
+            "categories": [
+                {
+                    "id": label_id,
+                    "name": label_name,
+                    "supercategory": ""
+                }
+                for label_id, label_name in sorted(categories_map.items())
+            ]
         }
 
-        # Extract unique categories from all annotations
-        categories_map = {}  # label_id -> category_info
-        annotation_id = 1
-
-        for image_idx, image in enumerate(images, start=1):
-            # Determine file name to use
-            # If use_relative_paths is True, use filename (may contain subdirs)
-            # Otherwise, extract just the basename from file_path
-            if use_relative_paths:
-                file_name = image.filename
-            else:
-                file_name = Path(image.file_path).name
-
-            # Add image entry
-            coco_data["images"].append({
-                "id": image_idx,
-                "file_name": file_name,
-                "width": image.width,
-                "height": image.height,
-                "date_captured": "",
-                "license": 0,
-                "coco_url": "",
-                "flickr_url": ""
-            })
-
-            # Add annotations for this image
-            for annotation in image.annotations:
-                # Track categories
-                if annotation.label_id not in categories_map:
-                    categories_map[annotation.label_id] = annotation.label_name
-
-                # Convert bounding box to COCO format [x, y, width, height]
-                bbox = [
-                    annotation.bounding_box.x,
-                    annotation.bounding_box.y,
-                    annotation.bounding_box.width,
-                    annotation.bounding_box.height
-                ]
-
-                # Calculate area
-                area = annotation.bounding_box.width * annotation.bounding_box.height
-
-                # Add annotation entry
-                coco_data["annotations"].append({
-                    "id": annotation_id,
-                    "image_id": image_idx,
-                    "category_id": annotation.label_id,
-                    "bbox": bbox,
-                    "area": area,
-                    "segmentation": [],
-                    "iscrowd": 0
-                })
-
-                annotation_id += 1
-
-        # Build categories list
-        for label_id in sorted(categories_map.keys()):
-            coco_data["categories"].append({
-                "id": label_id,
-                "name": categories_map[label_id],
-                "supercategory": ""
-            })
-
         if not coco_data["annotations"]:
             raise ValueError("No annotations to export")
 
         # Write to JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(coco_data, f, indent=2)
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(coco_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(coco_data, f, indent=2)
+
+    @staticmethod
+    def _coco_annotation(annotation: Annotation, annotation_id: int, image_id: int) -> dict[str, Any]:
+        """
+        Create one entry of the COCO annotations section.
+
+        Args:
+            annotation: Annotation to convert
+            annotation_id: 1-based COCO annotation ID
+            image_id: 1-based COCO ID of the annotation's image
+
+        Returns:
+            COCO annotation dictionary
+        """
+        box = annotation.bounding_box
+        return {
+            "id": annotation_id,
+            "image_id": image_id,
+            "category_id": annotation.label_id,
+            # COCO bbox format [x, y, width, height]
+            "bbox": [box.x, box.y, box.width, box.height],
+            "area": box.width * box.height,
+            "segmentation": [],
+            "iscrowd": 0
+        }
 
     def _create_info_section(self) -> dict[str, Any]:
         """
@@ -215,19 +254,22 @@ class ExportService:
             Dictionary with dataset statistics
         """
         total_images = len(images)
-        total_annotations = sum(len(img.annotations) for img in images)
+        total_annotations = 0
+        images_with_annotations = 0
 
-        # Count annotations per label
-        label_counts: dict[str, int] = {}
+        # Count annotations per label in the same pass
+        label_counts: Counter[str] = Counter()
         for image in images:
-            for annotation in image.annotations:
-                label_name = annotation.label_name
-                label_counts[label_name] = label_counts.get(label_name, 0) + 1
+            annotations = image.annotations
+            if annotations:
+                total_annotations += len(annotations)
+                images_with_annotations += 1
+                label_counts.update(annotation.label_name for annotation in annotations)
 
         return {
             "total_images": total_images,
             "total_annotations": total_annotations,
-            "images_with_annotations": sum(1 for img in images if img.annotations),
-            "images_without_annotations": sum(1 for img in images if not img.annotations),
-            "label_distribution": label_counts
+            "images_with_annotations": images_with_annotations,
+            "images_without_annotations": total_images - images_with_annotations,
+            "label_distribution": dict(label_counts)
         }
@@ -5,9 +5,11 @@ This module provides framework-agnostic business logic for managing
 a collection of images and navigating between them.
 """
 
+import os
 from typing import Optional
 from pathlib import Path
 from core.models import ImageMetadata, SubdirectoryConfig
+from utils.constants import SUPPORTED_FORMATS
 
 
 class ImageManager:
@@ -20,12 +22,15 @@ class ImageManager:
     Attributes:
         _images: Dictionary mapping image IDs to ImageMetadata objects
         _image_order: Ordered list of image IDs for navigation
+        _order_index: Mapping of image IDs to their position in _image_order
+                      (None when stale; rebuilt on the next lookup)
         _current_index: Index of currently displayed image
+        _current_image: Cached metadata at _current_index (None when there is none)
 
     Example:
         >>> manager = ImageManager()
         >>> img_id = manager.add_image("/path/to/image.jpg", metadata)
-        >>> current = manager.get_current_image()
+        >>> current = manager.current_image
         >>> next_img = manager.next_image()
     """
 
@@ -33,7 +38,9 @@ class ImageManager:
         """Initialize the image manager."""
         self._images: dict[str, ImageMetadata] = {}
         self._image_order: list[str] = []
+        self._order_index: Optional[dict[str, int]] = {}
         self._current_index: int = -1
+        self._current_image: Optional[ImageMetadata] = None
         self._base_path: Optional[str] = None  # Optional base path for relative paths
 
     def add_image(self, file_path: str, metadata: ImageMetadata) -> str:
@@ -51,11 +58,14 @@ class ImageManager:
         metadata.file_path = file_path
 
         self._images[metadata.id] = metadata
+        if self._order_index is not None:
+            self._order_index[metadata.id] = len(self._image_order)
         self._image_order.append(metadata.id)
 
         # Set as current if it's the first image
         if len(self._image_order) == 1:
             self._current_index = 0
+            self._sync_current_image()
 
         return metadata.id
 
@@ -73,7 +83,15 @@ class ImageManager:
             return False
 
         del self._images[image_id]
-        self._image_order.remove(image_id)
+        if self._order_index is not None:
+            position = self._order_index[image_id]
+        else:
+            position = self._image_order.index(image_id)
+        del self._image_order[position]
+
+        # Later positions shifted; rebuild the index lazily rather than
+        # renumbering it on every removal
+        self._order_index = None
 
         # Adjust current index if necessary
         if self._current_index >= len(self._image_order):
@@ -82,8 +100,20 @@ class ImageManager:
         if len(self._image_order) == 0:
             self._current_index = -1
 
+        # The image at the current index may have changed even if the index didn't
+        self._sync_current_image()
         return True
 
+    @property
+    def current_image(self) -> Optional[ImageMetadata]:
+        """
+        The currently displayed image (a plain attribute read).
+
+        Returns:
+            ImageMetadata if an image is selected, None otherwise
+        """
+        return self._current_image
+
     def get_current_image(self) -> Optional[ImageMetadata]:
         """
         Get the currently displayed image.
@@ -91,10 +121,14 @@ class ImageManager:
         Returns:
             ImageMetadata if an image is selected, None otherwise
         """
+        return self._current_image
+
+    def _sync_current_image(self) -> None:
+        """Refresh _current_image after _current_index or the order changes."""
         if 0 <= self._current_index < len(self._image_order):
-            image_id = self._image_order[self._current_index]
-            return self._images.get(image_id)
-        return None
+            self._current_image = self._images[self._image_order[self._current_index]]
+        else:
+            self._current_image = None
 
     def next_image(self) -> Optional[ImageMetadata]:
         """
@@ -108,8 +142,9 @@ class ImageManager:
 
         if self._current_index < len(self._image_order) - 1:
             self._current_index += 1
+            self._sync_current_image()
 
-        return self.get_current_image()
+        return self._current_image
 
     def previous_image(self) -> Optional[ImageMetadata]:
         """
@@ -123,8 +158,9 @@ class ImageManager:
 
         if self._current_index > 0:
             self._current_index -= 1
+            self._sync_current_image()
 
-        return self.get_current_image()
+        return self._current_image
 
     def goto_image(self, image_id: str) -> bool:
         """
@@ -136,14 +172,15 @@ class ImageManager:
         Returns:
             True if navigation successful, False if image not found
         """
-        if image_id not in self._images:
+        if self._order_index is None:
+            self._order_index = {img_id: i for i, img_id in enumerate(self._image_order)}
+        position = self._order_index.get(image_id)
+        if position is None:
             return False
 
-        try:
-            self._current_index = self._image_order.index(image_id)
-            return True
-        except ValueError:
-            return False
+        self._current_index = position
+        self._sync_current_image()
+        return True
 
     def get_image_count(self) -> int:
         """
@@ -182,7 +219,26 @@ class ImageManager:
         Returns:
             List of all ImageMetadata objects in navigation order
         """
-        return [self._images[img_id] for img_id in self._image_order if img_id in self._images]
+        return [self._images[img_id] for img_id in self._image_order]
+
+    def get_images_ahead(self, count: int, direction: int = 1) -> list[ImageMetadata]:
+        """
+        Get the images that follow the current one in a navigation direction.
+
+        Args:
+            count: Maximum number of images to return
+            direction: +1 for images after the current one, -1 for before
+
+        Returns:
+            Up to count ImageMetadata objects, nearest first
+        """
+        if self._current_index < 0:
+            return []
+
+        stop = len(self._image_order) if direction > 0 else -1
+        step = 1 if direction > 0 else -1
+        positions = range(self._current_index + step, stop, step)[:count]
+        return [self._images[self._image_order[i]] for i in positions]
 
     def set_base_path(self, base_path: str) -> None:
         """
@@ -224,33 +280,57 @@ class ImageManager:
         self._base_path = config.base_path
         loaded_count = 0
 
-        # Supported image extensions
-        image_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.gif']
+        # Collect (relative filename, absolute path) for every image first
+        candidates = self.find_subdirectory_images(config)
 
-        for subdir in config.subdirectories:
-            full_path = Path(config.base_path) / subdir
-
-            # Find all images in this subdirectory
-            for ext in image_extensions:
-                # Case-insensitive matching
-                for img_path in list(full_path.glob(f'*{ext}')) + list(full_path.glob(f'*{ext.upper()}')):
-                    if not img_path.is_file():
-                        continue
-
-                    try:
-                        # Load image using image_loader
-                        pixmap, metadata = image_loader.load_image(str(img_path))
-
-                        # Store relative path in filename for COCO export
-                        relative_path = img_path.relative_to(config.base_path)
-                        metadata.filename = str(relative_path)
-
-                        # Add to manager
-                        self.add_image(str(img_path), metadata)
-                        loaded_count += 1
-                    except Exception as e:
-                        # Skip files that can't be loaded
-                        print(f"Warning: Could not load {img_path}: {e}")
-                        continue
+        for relative_path, path in candidates:
+            try:
+                # Load image using image_loader
+                pixmap, metadata = image_loader.load_image(path)
+
+                # Store relative path in filename for COCO export
+                metadata.filename = relative_path
+
+                # Add to manager
+                self.add_image(path, metadata)
+                loaded_count += 1
+            except Exception as e:
+                # Skip files that can't be loaded
+                print(f"Warning: Could not load {path}: {e}")
+                continue
 
         return loaded_count
+
+    @staticmethod
+    def find_subdirectory_images(config: SubdirectoryConfig) -> list[tuple[str, str]]:
+        """
+        List the supported image files in each configured subdirectory.
+
+        Only touches the file system, so it is safe to call off the GUI thread.
+
+        Args:
+            config: SubdirectoryConfig with base path and subdirectories
+
+        Returns:
+            (relative filename, absolute path) pairs, sorted by name within
+            each subdirectory and grouped in subdirectory order
+        """
+        candidates: list[tuple[str, str]] = []
+        for subdir in config.subdirectories:
+            full_path = os.path.join(config.base_path, subdir)
+
+            # Find all images in this subdirectory with a single directory scan
+            with os.scandir(full_path) as it:
+                entries = sorted(
+                    (
+                        entry for entry in it
+                        if os.path.splitext(entry.name)[1].lower() in SUPPORTED_FORMATS
+                        and entry.is_file()
+                    ),
+                    key=lambda entry: entry.name
+                )
+
+            # Store relative path in filename for COCO export
+            candidates.extend((str(Path(subdir, entry.name)), entry.path) for entry in entries)
+
+        return candidates
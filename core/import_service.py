@@ -6,13 +6,41 @@ and convert them to internal data models.
 """
 
 import json
+import os
 import uuid
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
 from core.models import ImageMetadata, Annotation, BoundingBox
 
+try:
+    import orjson
+except ImportError:  # Optional dependency; fall back to stdlib json
+    orjson = None
+
+# Top-level keys every COCO JSON file must contain
+_REQUIRED_COCO_KEYS = frozenset({'images', 'annotations', 'categories'})
+
+
+def _generate_ids(count: int) -> Iterator[str]:
+    """
+    Generate random (version 4) UUID strings in bulk.
+
+    Reads all the random bytes with a single os.urandom call instead of
+    one call per uuid.uuid4().
+
+    Args:
+        count: Number of IDs to generate
+
+    Yields:
+        Hex UUID strings in the same format as core.models.new_id()
+    """
+    random_bytes = os.urandom(16 * count)
+    for offset in range(0, 16 * count, 16):
+        yield uuid.UUID(bytes=random_bytes[offset:offset + 16], version=4).hex
+
 
 class ImportService:
     """
@@ -62,8 +90,8 @@ class ImportService:
         if not coco_path.exists():
             raise FileNotFoundError(f"COCO file not found: {coco_path}")
 
-        with open(coco_path, 'r', encoding='utf-8') as f:
-            coco_data = json.load(f)
+        raw = coco_path.read_bytes()
+        coco_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
         # Validate format
         if not self._validate_coco_format(coco_data):
@@ -92,6 +120,7 @@ class ImportService:
 
         # Build ImageMetadata objects
         image_metadata_list = []
+        image_ids = _generate_ids(len(coco_data['images']))
         for coco_img in coco_data['images']:
             coco_img_id = coco_img['id']
 
@@ -103,12 +132,12 @@ class ImportService:
 
             # Create ImageMetadata
             metadata = ImageMetadata(
-                id=str(uuid.uuid4()),  # Generate new internal ID
+                id=next(image_ids),  # Generate new internal ID
                 file_path=file_path,
                 filename=coco_img['file_name'],
                 width=coco_img.get('width', 0),
                 height=coco_img.get('height', 0),
-                format=Path(coco_img['file_name']).suffix.upper().lstrip('.'),
+                format=os.path.splitext(coco_img['file_name'])[1][1:].upper(),
                 annotations=annotations_by_image.get(coco_img_id, [])
             )
 
@@ -126,8 +155,7 @@ class ImportService:
         Returns:
             True if valid, False otherwise
         """
-        required_keys = ['images', 'annotations', 'categories']
-        return all(key in coco_data for key in required_keys)
+        return isinstance(coco_data, dict) and _REQUIRED_COCO_KEYS <= coco_data.keys()
 
     def _match_images_to_files(
         self,
@@ -149,36 +177,42 @@ class ImportService:
         Returns:
             Dictionary mapping {coco_image_id: resolved_file_path}
         """
-        base_path = Path(base_path)
+        base_dir = str(base_path)
         image_map = {}
 
+        # basename -> files under base_path, built on first use so a single
+        # recursive walk serves every image that needs strategy 3
+        file_index: Optional[dict[str, list[Path]]] = None
+
         for img in coco_images:
             img_id = img['id']
             filename = img['file_name']
 
             # Strategy 1: Direct path (filename may include subdirs like "train/images/cat.jpg")
-            candidate = base_path / filename
-            if candidate.exists() and candidate.is_file():
-                image_map[img_id] = str(candidate.absolute())
+            candidate = os.path.join(base_dir, filename)
+            if os.path.isfile(candidate):
+                image_map[img_id] = os.path.abspath(candidate)
                 continue
 
             # Strategy 2: Search for filename only (ignore subdirs in file_name)
-            basename = Path(filename).name
-            candidate = base_path / basename
-            if candidate.exists() and candidate.is_file():
-                image_map[img_id] = str(candidate.absolute())
+            basename = os.path.basename(filename)
+            candidate = os.path.join(base_dir, basename)
+            if os.path.isfile(candidate):
+                image_map[img_id] = os.path.abspath(candidate)
                 continue
 
             # Strategy 3: Recursive search
-            matches = list(base_path.rglob(basename))
+            if file_index is None:
+                file_index = {}
+                for path in Path(base_dir).rglob('*'):
+                    if path.is_file():
+                        file_index.setdefault(path.name, []).append(path)
+
+            matches = file_index.get(basename)
             if matches:
                 # Use first match
-                for match in matches:
-                    if match.is_file():
-                        image_map[img_id] = str(match.absolute())
-                        break
-                if img_id in image_map:
-                    continue
+                image_map[img_id] = str(matches[0].absolute())
+                continue
 
             print(f"Warning: Could not find image file: {filename}")
 
@@ -211,35 +245,23 @@ class ImportService:
         Returns:
             Dictionary mapping {coco_image_id: [Annotation, ...]}
         """
-        annotations_by_image: dict[int, list[Annotation]] = {}
+        annotations_by_image: dict[int, list[Annotation]] = defaultdict(list)
+        now = datetime.now()
+        annotation_ids = _generate_ids(len(coco_annotations))
 
         for coco_ann in coco_annotations:
-            image_id = coco_ann['image_id']
             category_id = coco_ann['category_id']
-            bbox_coco = coco_ann['bbox']  # [x, y, width, height]
-
-            # Create BoundingBox
-            box = BoundingBox(
-                x=int(bbox_coco[0]),
-                y=int(bbox_coco[1]),
-                width=int(bbox_coco[2]),
-                height=int(bbox_coco[3])
-            )
+            x, y, width, height = map(int, coco_ann['bbox'])  # [x, y, width, height]
 
-            # Create Annotation
-            annotation = Annotation(
-                id=str(uuid.uuid4()),  # Generate new internal ID
-                bounding_box=box,
+            # Create Annotation, grouped by image
+            annotations_by_image[coco_ann['image_id']].append(Annotation(
+                id=next(annotation_ids),  # Generate new internal ID
+                bounding_box=BoundingBox(x, y, width, height),
                 label_id=category_id,
                 label_name=label_map.get(category_id, f"unknown_{category_id}"),
                 image_id="",  # Will be set when added to ImageMetadata
-                created_at=datetime.now(),
-                modified_at=datetime.now()
-            )
-
-            # Group by image
-            if image_id not in annotations_by_image:
-                annotations_by_image[image_id] = []
-            annotations_by_image[image_id].append(annotation)
+                created_at=now,
+                modified_at=now
+            ))
 
-        return annotations_by_image
+        return dict(annotations_by_image)
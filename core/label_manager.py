@@ -5,7 +5,8 @@ This module manages the predefined set of labels and their integer IDs
 for an annotation project.
 """
 
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 
 class LabelManager:
@@ -17,6 +18,9 @@ class LabelManager:
 
     Attributes:
         _labels: Dictionary mapping label IDs to label names
+        _name_to_id: Reverse index mapping label names to label IDs
+        _sorted_labels: Cached result of get_label_list (None when stale)
+        _labels_view: Cached read-only view of _labels (None when stale)
 
     Example:
         >>> manager = LabelManager()
@@ -28,6 +32,9 @@ class LabelManager:
     def __init__(self):
         """Initialize the label manager."""
         self._labels: dict[int, str] = {}
+        self._name_to_id: dict[str, int] = {}
+        self._sorted_labels: Optional[list[tuple[int, str]]] = None
+        self._labels_view: Optional[Mapping[int, str]] = None
 
     def set_labels(self, labels: dict[int, str]) -> None:
         """
@@ -38,6 +45,9 @@ class LabelManager:
                    e.g., {1: "cat", 2: "dog", 3: "person"}
         """
         self._labels = labels.copy()
+        self._rebuild_name_index()
+        self._sorted_labels = None
+        self._labels_view = None  # _labels is a new dict now
 
     def add_label(self, label_id: int, label_name: str) -> None:
         """
@@ -47,7 +57,15 @@ class LabelManager:
             label_id: Integer ID for the label
             label_name: Name of the label
         """
+        previous_name = self._labels.get(label_id)
         self._labels[label_id] = label_name
+        self._sorted_labels = None
+
+        if previous_name is None:
+            self._name_to_id.setdefault(label_name, label_id)
+        elif previous_name != label_name:
+            # An existing ID was renamed; its old name may map elsewhere now
+            self._rebuild_name_index()
 
     def get_label_name(self, label_id: int) -> Optional[str]:
         """
@@ -71,19 +89,22 @@ class LabelManager:
         Returns:
             Label ID if found, None otherwise
         """
-        for label_id, name in self._labels.items():
-            if name == label_name:
-                return label_id
-        return None
+        return self._name_to_id.get(label_name)
 
-    def get_all_labels(self) -> dict[int, str]:
+    def get_all_labels(self) -> Mapping[int, str]:
         """
         Get all labels.
 
+        The result is a cached read-only view, so this does not copy; it
+        reflects later add_label/clear_labels calls. Use dict(...) for a
+        snapshot that can be modified.
+
         Returns:
-            Dictionary mapping label IDs to names
+            Read-only mapping of label IDs to names
         """
-        return self._labels.copy()
+        if self._labels_view is None:
+            self._labels_view = MappingProxyType(self._labels)
+        return self._labels_view
 
     def get_label_list(self) -> list[tuple[int, str]]:
         """
@@ -92,7 +113,10 @@ class LabelManager:
         Returns:
             List of (label_id, label_name) tuples sorted by ID
         """
-        return sorted(self._labels.items(), key=lambda x: x[0])
+        if self._sorted_labels is None:
+            # IDs are unique, so plain tuple ordering sorts by ID
+            self._sorted_labels = sorted(self._labels.items())
+        return self._sorted_labels.copy()
 
     def has_labels(self) -> bool:
         """
@@ -106,3 +130,9 @@ class LabelManager:
     def clear_labels(self) -> None:
         """Clear all labels."""
         self._labels.clear()
+        self._name_to_id.clear()
+        self._sorted_labels = None
+
+    def _rebuild_name_index(self) -> None:
+        """Rebuild the name -> ID index (first ID wins for duplicate names)."""
+        self._name_to_id = {name: label_id for label_id, name in reversed(self._labels.items())}
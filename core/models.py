@@ -5,14 +5,69 @@ This module contains framework-agnostic data models that can be used
 with any UI framework (PyQt, web, CLI, etc.).
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 from pathlib import Path
 import uuid
 
 
-@dataclass
+def new_id() -> str:
+    """Generate a unique model ID (32-character hex UUID4)."""
+    return uuid.uuid4().hex
+
+
+# Timestamp shared by every model created inside a batch_timestamp() block
+_batch_now: ContextVar[Optional[datetime]] = ContextVar('_batch_now', default=None)
+
+
+def _now() -> datetime:
+    """Current time, or the shared batch timestamp when one is active."""
+    return _batch_now.get() or datetime.now()
+
+
+@contextmanager
+def batch_timestamp() -> Iterator[datetime]:
+    """
+    Share a single datetime.now() across all models created in the block.
+
+    Used for bulk construction/deserialization so that default timestamps
+    cost one clock read per batch instead of one or two per annotation.
+    Nested blocks reuse the outer timestamp.
+
+    Example:
+        >>> with batch_timestamp():
+        ...     annotations = [Annotation.from_dict(d) for d in data]
+
+    Yields:
+        The shared timestamp
+    """
+    now = _batch_now.get()
+    if now is not None:
+        yield now
+        return
+
+    now = datetime.now()
+    token = _batch_now.set(now)
+    try:
+        yield now
+    finally:
+        _batch_now.reset(token)
+
+
+def point_in_box(box_x: int, box_y: int, width: int, height: int, x: int, y: int) -> bool:
+    """
+    Check if a point is inside a box given as raw coordinates.
+
+    Same test as BoundingBox.contains_point, for hit-testing loops that
+    already hold box coordinates and want to skip per-box method dispatch.
+    """
+    return box_x <= x <= box_x + width and box_y <= y <= box_y + height
+
+
+@dataclass(slots=True)
 class BoundingBox:
     """
     Represents a rectangular bounding box.
@@ -40,34 +95,36 @@ class BoundingBox:
     @classmethod
     def from_dict(cls, data: dict) -> 'BoundingBox':
         """Create BoundingBox from dictionary."""
-        return cls(
-            x=data['x'],
-            y=data['y'],
-            width=data['width'],
-            height=data['height']
-        )
+        # Skip the generated __init__; every field is assigned below
+        box = object.__new__(cls)
+        box.x = data['x']
+        box.y = data['y']
+        box.width = data['width']
+        box.height = data['height']
+        return box
 
     def contains_point(self, x: int, y: int) -> bool:
         """Check if a point is inside this bounding box."""
-        return (self.x <= x <= self.x + self.width and
-                self.y <= y <= self.y + self.height)
+        box_x = self.x
+        box_y = self.y
+        return box_x <= x <= box_x + self.width and box_y <= y <= box_y + self.height
 
-    def to_coco_format(self) -> list[float]:
+    def to_coco_format(self) -> list[int]:
         """Convert to COCO format [x, y, width, height]."""
-        return [float(self.x), float(self.y), float(self.width), float(self.height)]
+        return [self.x, self.y, self.width, self.height]
 
     def to_csv_format(self) -> str:
         """Convert to CSV format string."""
         return f"{self.x},{self.y},{self.width},{self.height}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Annotation:
     """
     Single annotation on an image.
 
     Attributes:
-        id: Unique identifier (UUID)
+        id: Unique identifier (hex UUID)
         bounding_box: The bounding box for this annotation
         label_id: Integer ID of the label category
         label_name: Name of the label (for convenience)
@@ -75,38 +132,66 @@ class Annotation:
         created_at: Creation timestamp
         modified_at: Last modification timestamp
     """
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     bounding_box: Optional[BoundingBox] = None
     label_id: int = 0
     label_name: str = ""
     image_id: str = ""
-    created_at: datetime = field(default_factory=datetime.now)
-    modified_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
+    modified_at: datetime = field(default_factory=_now)
+
+    # (timestamp, isoformat string) pairs reused by to_dict while the
+    # timestamp object is unchanged
+    _created_iso: Optional[tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _modified_iso: Optional[tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
+        created = self._created_iso
+        if created is None or created[0] is not self.created_at:
+            created = self._created_iso = (self.created_at, self.created_at.isoformat())
+
+        modified = self._modified_iso
+        if modified is None or modified[0] is not self.modified_at:
+            modified = self._modified_iso = (self.modified_at, self.modified_at.isoformat())
+
+        box = self.bounding_box
         return {
             'id': self.id,
-            'bounding_box': self.bounding_box.to_dict() if self.bounding_box else None,
+            'bounding_box': None if box is None else box.to_dict(),
             'label_id': self.label_id,
             'label_name': self.label_name,
             'image_id': self.image_id,
-            'created_at': self.created_at.isoformat(),
-            'modified_at': self.modified_at.isoformat()
+            'created_at': created[1],
+            'modified_at': modified[1]
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Annotation':
         """Create Annotation from dictionary."""
-        return cls(
-            id=data.get('id', str(uuid.uuid4())),
-            bounding_box=BoundingBox.from_dict(data['bounding_box']) if data.get('bounding_box') else None,
-            label_id=data.get('label_id', 0),
-            label_name=data.get('label_name', ''),
-            image_id=data.get('image_id', ''),
-            created_at=datetime.fromisoformat(data['created_at']) if 'created_at' in data else datetime.now(),
-            modified_at=datetime.fromisoformat(data['modified_at']) if 'modified_at' in data else datetime.now()
-        )
+        get = data.get
+        box = get('bounding_box')
+        created_at = get('created_at')
+        modified_at = get('modified_at')
+
+        # Skip the generated __init__ (and its default factories); every
+        # field is assigned below
+        annotation = object.__new__(cls)
+        annotation.id = get('id') or new_id()
+        annotation.bounding_box = BoundingBox.from_dict(box) if box else None
+        annotation.label_id = get('label_id', 0)
+        annotation.label_name = get('label_name', '')
+        annotation.image_id = get('image_id', '')
+        now = _now() if not (created_at and modified_at) else None
+        annotation.created_at = datetime.fromisoformat(created_at) if created_at else now
+        annotation.modified_at = datetime.fromisoformat(modified_at) if modified_at else now
+        annotation._created_iso = None
+        annotation._modified_iso = None
+        return annotation
 
     def update_box(self, box: BoundingBox) -> None:
         """Update the bounding box and modification timestamp."""
@@ -120,21 +205,24 @@ class Annotation:
         self.modified_at = datetime.now()
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageMetadata:
     """
     Image information without pixel data.
 
     Attributes:
-        id: Unique identifier (UUID)
+        id: Unique identifier (hex UUID)
         file_path: Absolute path to image file
         filename: Base filename
         width: Image width in pixels
         height: Image height in pixels
         format: Image format (JPEG, PNG, etc.)
-        annotations: List of annotations for this image
+        annotations: List of annotations for this image (modify through
+                     add_annotation/remove_annotation so the ID index stays in sync)
+        annotation_rev: Counter bumped on every add_annotation/remove_annotation,
+                        so views can tell whether the annotation list changed
     """
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     file_path: str = ""
     filename: str = ""
     width: int = 0
@@ -142,6 +230,16 @@ class ImageMetadata:
     format: str = ""
     annotations: list[Annotation] = field(default_factory=list)
 
+    # Annotation ID -> Annotation index for get/remove by ID
+    _annotations_by_id: dict[str, Annotation] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    annotation_rev: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Build the annotation ID index."""
+        self._annotations_by_id = {ann.id: ann for ann in self.annotations}
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -157,19 +255,28 @@ class ImageMetadata:
     @classmethod
     def from_dict(cls, data: dict) -> 'ImageMetadata':
         """Create ImageMetadata from dictionary."""
-        return cls(
-            id=data.get('id', str(uuid.uuid4())),
-            file_path=data.get('file_path', ''),
-            filename=data.get('filename', ''),
-            width=data.get('width', 0),
-            height=data.get('height', 0),
-            format=data.get('format', ''),
-            annotations=[Annotation.from_dict(ann) for ann in data.get('annotations', [])]
-        )
+        get = data.get
+        annotation_from_dict = Annotation.from_dict
+
+        # Skip the generated __init__; every field is assigned below
+        image = object.__new__(cls)
+        image.id = get('id') or new_id()
+        image.file_path = get('file_path', '')
+        image.filename = get('filename', '')
+        image.width = get('width', 0)
+        image.height = get('height', 0)
+        image.format = get('format', '')
+        with batch_timestamp():
+            image.annotations = [annotation_from_dict(ann) for ann in get('annotations', ())]
+        image._annotations_by_id = {ann.id: ann for ann in image.annotations}
+        image.annotation_rev = 0
+        return image
 
     def add_annotation(self, annotation: Annotation) -> None:
         """Add an annotation to this image."""
         self.annotations.append(annotation)
+        self._annotations_by_id[annotation.id] = annotation
+        self.annotation_rev += 1
 
     def remove_annotation(self, annotation_id: str) -> bool:
         """
@@ -178,16 +285,24 @@ class ImageMetadata:
         Returns:
             True if annotation was removed, False if not found
         """
-        initial_length = len(self.annotations)
-        self.annotations = [ann for ann in self.annotations if ann.id != annotation_id]
-        return len(self.annotations) < initial_length
+        annotation = self._annotations_by_id.pop(annotation_id, None)
+        if annotation is None:
+            return False
+
+        # Match by identity: list.remove would compare field tuples via the
+        # dataclass __eq__ and could drop an equal-valued twin instead.
+        # Scan from the end, where recently drawn annotations sit.
+        annotations = self.annotations
+        for i in range(len(annotations) - 1, -1, -1):
+            if annotations[i] is annotation:
+                del annotations[i]
+                break
+        self.annotation_rev += 1
+        return True
 
     def get_annotation(self, annotation_id: str) -> Optional[Annotation]:
         """Get an annotation by ID."""
-        for ann in self.annotations:
-            if ann.id == annotation_id:
-                return ann
-        return None
+        return self._annotations_by_id.get(annotation_id)
 
 
 @dataclass
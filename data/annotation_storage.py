@@ -16,15 +16,26 @@ class AnnotationStorage:
     MVP implementation uses in-memory storage.
     Future versions can extend this to persist to disk or database.
 
+    By default lists are stored and returned as-is, so callers must not
+    mutate a list after saving it or on the result of load_annotations.
+    Pass defensive_copy=True to copy on both save and load instead.
+
     Example:
         >>> storage = AnnotationStorage()
         >>> storage.save_annotations("img_1", [annotation1, annotation2])
         >>> annotations = storage.load_annotations("img_1")
     """
 
-    def __init__(self):
-        """Initialize the storage."""
+    def __init__(self, defensive_copy: bool = False):
+        """
+        Initialize the storage.
+
+        Args:
+            defensive_copy: Whether to copy annotation lists on save and load
+                            (default: False)
+        """
         self._storage: dict[str, list[Annotation]] = {}
+        self._defensive_copy = defensive_copy
 
     def save_annotations(self, image_id: str, annotations: list[Annotation]) -> bool:
         """
@@ -37,7 +48,7 @@ class AnnotationStorage:
         Returns:
             True if successful
         """
-        self._storage[image_id] = annotations.copy()
+        self._storage[image_id] = list(annotations) if self._defensive_copy else annotations
         return True
 
     def load_annotations(self, image_id: str) -> list[Annotation]:
@@ -50,7 +61,10 @@ class AnnotationStorage:
         Returns:
             List of annotations (empty list if none exist)
         """
-        return self._storage.get(image_id, []).copy()
+        annotations = self._storage.get(image_id)
+        if annotations is None:
+            return []
+        return annotations.copy() if self._defensive_copy else annotations
 
     def delete_annotations(self, image_id: str) -> bool:
         """
@@ -4,11 +4,82 @@ Image file loading and caching.
 This module handles the actual file I/O operations for loading images.
 """
 
+import os
+import stat
 from pathlib import Path
-from typing import Optional
-from PyQt6.QtGui import QPixmap
+from typing import Callable, Optional
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
 from core.models import ImageMetadata
-from utils.constants import SUPPORTED_FORMATS
+from utils.constants import SUPPORTED_FORMATS, IMAGE_CACHE_MAX_BYTES
+
+# Stale cache keys are pruned once this many have accumulated
+_CACHE_KEYS_PRUNE_MIN = 64
+
+
+class _DecodeBridge(QObject):
+    """
+    Carries decode results from pool threads back to the GUI thread.
+
+    Lives in the thread that created the ImageLoader; signals emitted by
+    worker threads are therefore delivered to its slots as queued calls.
+    """
+
+    decoded = pyqtSignal(str, QImage)  # file_path, image
+    failed = pyqtSignal(str, str)      # file_path, error message
+
+    def __init__(self, loader: 'ImageLoader'):
+        """
+        Initialize the bridge.
+
+        Args:
+            loader: ImageLoader that receives the results
+        """
+        super().__init__()
+        self._loader = loader
+        self.decoded.connect(self._on_decoded)
+        self.failed.connect(self._on_failed)
+
+    @pyqtSlot(str, QImage)
+    def _on_decoded(self, file_path: str, image: QImage) -> None:
+        """Forward a decoded image to the loader."""
+        self._loader._finish_async_load(file_path, image)
+
+    @pyqtSlot(str, str)
+    def _on_failed(self, file_path: str, message: str) -> None:
+        """Forward a decode failure to the loader."""
+        self._loader._fail_async_load(file_path, message)
+
+
+class _DecodeTask(QRunnable):
+    """
+    Decodes one image file on a QThreadPool thread.
+
+    Only QImage is used here; QPixmap must be created on the GUI thread.
+    """
+
+    def __init__(self, file_path: str, bridge: _DecodeBridge):
+        """
+        Initialize the task.
+
+        Args:
+            file_path: Image file to decode
+            bridge: Bridge that receives the result
+        """
+        super().__init__()
+        self._file_path = file_path
+        self._bridge = bridge
+
+    def run(self) -> None:
+        """Decode the image and emit the result through the bridge."""
+        image = QImageReader(self._file_path).read()
+        if image.isNull():
+            self._bridge.failed.emit(
+                self._file_path,
+                f"Invalid image file or unsupported format: {self._file_path}"
+            )
+        else:
+            self._bridge.decoded.emit(self._file_path, image)
 
 
 class ImageLoader:
@@ -19,8 +90,12 @@ class ImageLoader:
     It handles the actual file I/O and pixel data management.
 
     Attributes:
-        _cache: Optional cache of loaded pixmaps
+        _cache_keys: QPixmapCache key for each cached file path (a key
+                     becomes invalid once Qt evicts its pixmap)
+        _cache_keys_prune_at: Size of _cache_keys that triggers pruning
+        _cache_limit_kb: QPixmapCache limit to ensure while caching is enabled
         _cache_enabled: Whether caching is enabled
+        _pending: Callbacks waiting on each in-flight background decode
 
     Example:
         >>> loader = ImageLoader()
@@ -28,15 +103,30 @@ class ImageLoader:
         >>> print(f"Loaded {metadata.width}x{metadata.height} image")
     """
 
-    def __init__(self, cache_enabled: bool = False):
+    def __init__(
+        self,
+        cache_enabled: bool = False,
+        max_cache_bytes: int = IMAGE_CACHE_MAX_BYTES
+    ):
         """
         Initialize the image loader.
 
         Args:
             cache_enabled: Whether to enable pixmap caching (default: False)
+            max_cache_bytes: Minimum QPixmapCache limit to ensure while
+                             caching is enabled (default: IMAGE_CACHE_MAX_BYTES)
         """
-        self._cache: dict[str, QPixmap] = {}
-        self._cache_enabled = cache_enabled
+        # Pixmaps live in Qt's shared QPixmapCache, which evicts least
+        # recently used entries under its byte limit
+        self._cache_keys: dict[str, QPixmapCache.Key] = {}
+        self._cache_keys_prune_at = _CACHE_KEYS_PRUNE_MIN
+        self._cache_limit_kb = max_cache_bytes // 1024
+        self._cache_enabled = False
+        self.enable_cache(cache_enabled)
+
+        # Background loading state
+        self._pending: dict[str, list[tuple[Optional[Callable], Optional[Callable]]]] = {}
+        self._decode_bridge = _DecodeBridge(self)
 
     def load_image(self, file_path: str) -> tuple[QPixmap, ImageMetadata]:
         """
@@ -57,32 +147,142 @@ class ImageLoader:
             raise FileNotFoundError(f"Image file not found: {file_path}")
 
         # Check cache if enabled
-        if self._cache_enabled and file_path in self._cache:
-            pixmap = self._cache[file_path]
-        else:
-            # Load pixmap
-            pixmap = QPixmap(file_path)
-            if pixmap.isNull():
+        pixmap = self._cached_pixmap(file_path)
+        if pixmap is None:
+            # Decode pixel data
+            image = QImageReader(file_path).read()
+            if image.isNull():
                 raise ValueError(
                     f"Invalid image file or unsupported format: {file_path}"
                 )
+            pixmap = QPixmap.fromImage(image)
 
             # Cache if enabled
             if self._cache_enabled:
-                self._cache[file_path] = pixmap
+                self._add_to_cache(file_path, pixmap)
 
         # Extract metadata
+        metadata = self._create_metadata(file_path, pixmap.width(), pixmap.height())
+
+        return pixmap, metadata
+
+    def load_image_async(
+        self,
+        file_path: str,
+        callback: Optional[Callable[[QPixmap, ImageMetadata], None]] = None,
+        error_callback: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """
+        Load an image on a QThreadPool thread and report back on this thread.
+
+        Concurrent requests for the same file share one decode. If the
+        pixmap is already cached, callback runs before this method returns.
+
+        Args:
+            file_path: Absolute path to the image file
+            callback: Called with (QPixmap, ImageMetadata) once loaded
+            error_callback: Called with an error message if loading fails
+        """
+        if not self.validate_file(file_path):
+            if error_callback:
+                error_callback(f"Image file not found: {file_path}")
+            return
+
+        if self._cached_pixmap(file_path) is not None:
+            pixmap, metadata = self.load_image(file_path)
+            if callback:
+                callback(pixmap, metadata)
+            return
+
+        waiting = self._pending.get(file_path)
+        if waiting is not None:
+            waiting.append((callback, error_callback))
+            return
+
+        self._pending[file_path] = [(callback, error_callback)]
+        QThreadPool.globalInstance().start(_DecodeTask(file_path, self._decode_bridge))
+
+    def prefetch(self, file_paths: list[str]) -> None:
+        """
+        Decode images in the background so later loads hit the cache.
+
+        Does nothing while caching is disabled, since results would be dropped.
+
+        Args:
+            file_paths: Paths likely to be displayed soon
+        """
+        if not self._cache_enabled:
+            return
+
+        for file_path in file_paths:
+            if file_path not in self._pending and self._cached_pixmap(file_path) is None:
+                self.load_image_async(file_path)
+
+    def _finish_async_load(self, file_path: str, image: QImage) -> None:
+        """Complete a background load on the GUI thread."""
+        waiting = self._pending.pop(file_path, [])
+
+        pixmap = QPixmap.fromImage(image)
+        if self._cache_enabled:
+            self._add_to_cache(file_path, pixmap)
+
+        for callback, _ in waiting:
+            if callback:
+                callback(pixmap, self._create_metadata(file_path, pixmap.width(), pixmap.height()))
+
+    def _fail_async_load(self, file_path: str, message: str) -> None:
+        """Report a failed background load on the GUI thread."""
+        for _, error_callback in self._pending.pop(file_path, []):
+            if error_callback:
+                error_callback(message)
+
+    def load_metadata_only(self, file_path: str) -> ImageMetadata:
+        """
+        Read image metadata from the file header without decoding pixels.
+
+        Args:
+            file_path: Absolute path to the image file
+
+        Returns:
+            ImageMetadata with dimensions read from the image header
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file is not a valid image
+        """
+        if not self.validate_file(file_path):
+            raise FileNotFoundError(f"Image file not found: {file_path}")
+
+        reader = QImageReader(file_path)
+        size = reader.size()
+        if not size.isValid():
+            raise ValueError(
+                f"Invalid image file or unsupported format: {file_path}"
+            )
+
+        return self._create_metadata(file_path, size.width(), size.height())
+
+    def _create_metadata(self, file_path: str, width: int, height: int) -> ImageMetadata:
+        """
+        Build ImageMetadata for a file.
+
+        Args:
+            file_path: Absolute path to the image file
+            width: Image width in pixels
+            height: Image height in pixels
+
+        Returns:
+            ImageMetadata for the file
+        """
         path = Path(file_path)
-        metadata = ImageMetadata(
+        return ImageMetadata(
             file_path=file_path,
             filename=path.name,
-            width=pixmap.width(),
-            height=pixmap.height(),
+            width=width,
+            height=height,
             format=path.suffix.upper().replace('.', '')  # e.g., 'JPG', 'PNG'
         )
 
-        return pixmap, metadata
-
     def validate_file(self, file_path: str) -> bool:
         """
         Check if file exists and has a valid image extension.
@@ -93,30 +293,101 @@ class ImageLoader:
         Returns:
             True if file is valid, False otherwise
         """
-        path = Path(file_path)
-
-        if not path.exists():
+        # Single stat() covers both the existence and regular-file checks
+        try:
+            st = os.stat(file_path)
+        except (OSError, ValueError):
             return False
 
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return False
 
         # Check extension
-        extension = path.suffix.lower()
-        return extension in SUPPORTED_FORMATS
+        return os.path.splitext(file_path)[1].lower() in SUPPORTED_FORMATS
 
     def get_supported_formats(self) -> list[str]:
         """
         Get list of supported image formats.
 
         Returns:
-            List of supported file extensions (e.g., ['.jpg', '.png'])
+            Sorted list of supported file extensions (e.g., ['.bmp', '.gif'])
+        """
+        return sorted(SUPPORTED_FORMATS)
+
+    def cache_pixmap(self, file_path: str, pixmap: QPixmap) -> None:
         """
-        return SUPPORTED_FORMATS.copy()
+        Store an already decoded pixmap as the most recently used cache entry.
+
+        Lets callers that decoded a file themselves spare the next
+        load_image call a second decode. Does nothing while caching is disabled.
+
+        Args:
+            file_path: Path the pixmap was decoded from
+            pixmap: Decoded pixmap
+        """
+        if not self._cache_enabled:
+            return
+
+        # A hit already marks the entry as recently used
+        if self._cached_pixmap(file_path) is None:
+            self._add_to_cache(file_path, pixmap)
+
+    def _cached_pixmap(self, file_path: str) -> Optional[QPixmap]:
+        """
+        Look up a cached pixmap, marking it as recently used.
+
+        Args:
+            file_path: Path the pixmap was decoded from
+
+        Returns:
+            Cached QPixmap, or None if caching is disabled or it was evicted
+        """
+        if not self._cache_enabled:
+            return None
+        key = self._cache_keys.get(file_path)
+        if key is None:
+            return None
+        return QPixmapCache.find(key)
+
+    def _add_to_cache(self, file_path: str, pixmap: QPixmap) -> None:
+        """
+        Insert a pixmap into the cache; Qt evicts least recently used
+        entries once the cache limit is exceeded.
+
+        Args:
+            file_path: Path the pixmap was decoded from
+            pixmap: Pixmap to cache
+        """
+        key = self._cache_keys.get(file_path)
+        if key is not None and key.isValid() and QPixmapCache.replace(key, pixmap):
+            return
+
+        key = QPixmapCache.insert(pixmap)
+        if not key.isValid():
+            # Larger than the whole cache limit
+            self._cache_keys.pop(file_path, None)
+            return
+        self._cache_keys[file_path] = key
+
+        if len(self._cache_keys) >= self._cache_keys_prune_at:
+            self._prune_cache_keys()
+
+    def _prune_cache_keys(self) -> None:
+        """Forget keys whose pixmaps Qt has evicted."""
+        # isValid() does not count as a use, so LRU order is left alone
+        self._cache_keys = {
+            path: key for path, key in self._cache_keys.items() if key.isValid()
+        }
+        # Amortize: prune again only once the live set has doubled
+        self._cache_keys_prune_at = max(_CACHE_KEYS_PRUNE_MIN, 2 * len(self._cache_keys))
 
     def clear_cache(self) -> None:
-        """Clear the pixmap cache."""
-        self._cache.clear()
+        """Clear this loader's pixmaps from the cache."""
+        # QPixmapCache is shared, so remove only our own entries
+        for key in self._cache_keys.values():
+            QPixmapCache.remove(key)
+        self._cache_keys.clear()
+        self._cache_keys_prune_at = _CACHE_KEYS_PRUNE_MIN
 
     def enable_cache(self, enabled: bool = True) -> None:
         """
@@ -126,5 +397,9 @@ class ImageLoader:
             enabled: Whether to enable caching
         """
         self._cache_enabled = enabled
-        if not enabled:
+        if enabled:
+            # The limit is process-wide; only ever raise it
+            if QPixmapCache.cacheLimit() < self._cache_limit_kb:
+                QPixmapCache.setCacheLimit(self._cache_limit_kb)
+        else:
             self.clear_cache()
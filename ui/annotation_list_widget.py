@@ -12,6 +12,9 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal
 from core.models import Annotation
 
+# Item data role holding the annotation ID
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
 
 class AnnotationListWidget(QWidget):
     """
@@ -46,6 +49,7 @@ class AnnotationListWidget(QWidget):
         super().__init__(parent)
 
         self._current_annotations: list[Annotation] = []
+        self._id_to_row: dict[str, int] = {}
 
         # Setup UI
         layout = QVBoxLayout()
@@ -87,17 +91,24 @@ class AnnotationListWidget(QWidget):
         Args:
             annotations: List of Annotation objects
         """
-        self._current_annotations = annotations
-
-        # Clear and repopulate list
-        self.list_widget.clear()
-
-        for annotation in annotations:
-            # Format: "ID: name - uuid"
-            display_text = f"{annotation.label_id}: {annotation.label_name} - {annotation.id[:8]}"
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.ItemDataRole.UserRole, annotation.id)
-            self.list_widget.addItem(item)
+        # Own a copy so incremental add/remove keeps rows and list aligned
+        self._current_annotations = list(annotations)
+
+        # Clear and repopulate list with repaints and signals suspended,
+        # so the view refreshes once instead of once per item
+        list_widget = self.list_widget
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            list_widget.clear()
+            self._id_to_row = {}
+
+            for row, annotation in enumerate(annotations):
+                list_widget.addItem(self._make_item(annotation))
+                self._id_to_row[annotation.id] = row
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
 
         # Update header
         count = len(annotations)
@@ -108,10 +119,65 @@ class AnnotationListWidget(QWidget):
         self.edit_btn.setEnabled(False)  # Enable only when selected
         self.delete_btn.setEnabled(False)
 
+    def add_annotation(self, annotation: Annotation) -> None:
+        """
+        Append one annotation to the list without rebuilding it.
+
+        Args:
+            annotation: Annotation to add
+        """
+        self._id_to_row[annotation.id] = len(self._current_annotations)
+        self._current_annotations.append(annotation)
+        self.list_widget.addItem(self._make_item(annotation))
+        self.header_label.setText(f"Annotations ({len(self._current_annotations)})")
+
+    def remove_annotation(self, annotation_id: str) -> None:
+        """
+        Remove one annotation from the list without rebuilding it.
+
+        Args:
+            annotation_id: ID of annotation to remove
+        """
+        row = self._id_to_row.pop(annotation_id, None)
+        if row is None:
+            return
+
+        del self._current_annotations[row]
+        self.list_widget.takeItem(row)
+
+        # Rows after the removed one moved up by one
+        for i in range(row, len(self._current_annotations)):
+            self._id_to_row[self._current_annotations[i].id] = i
+
+        self.header_label.setText(f"Annotations ({len(self._current_annotations)})")
+
+        # Selection moves off the removed row; require an explicit reselect
+        self.list_widget.clearSelection()
+        self.edit_btn.setEnabled(False)
+        self.delete_btn.setEnabled(False)
+
+    @staticmethod
+    def _make_item(annotation: Annotation) -> QListWidgetItem:
+        """
+        Build the list item for an annotation.
+
+        Args:
+            annotation: Annotation to display
+
+        Returns:
+            QListWidgetItem carrying the annotation ID
+        """
+        # Format: "ID: name - uuid"
+        display_text = f"{annotation.label_id}: {annotation.label_name} - {annotation.id[:8]}"
+        item = QListWidgetItem(display_text)
+        item.setData(_USER_ROLE, annotation.id)
+        return item
+
     def clear(self) -> None:
         """Clear all annotations from the list."""
         self.list_widget.clear()
         self._current_annotations = []
+        self._id_to_row = {}
         self.header_label.setText("Annotations (0)")
         self.edit_btn.setEnabled(False)
         self.delete_btn.setEnabled(False)
@@ -123,14 +189,13 @@ class AnnotationListWidget(QWidget):
         Args:
             annotation_id: ID of annotation to select
         """
-        # Find and select the item with this annotation ID
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item and item.data(Qt.ItemDataRole.UserRole) == annotation_id:
-                self.list_widget.setCurrentItem(item)
-                self.edit_btn.setEnabled(True)
-                self.delete_btn.setEnabled(True)
-                return
+        # Look up the row holding this annotation ID
+        row = self._id_to_row.get(annotation_id)
+        if row is not None:
+            self.list_widget.setCurrentRow(row)
+            self.edit_btn.setEnabled(True)
+            self.delete_btn.setEnabled(True)
+            return
 
         # Deselect if not found
         self.list_widget.clearSelection()
@@ -144,7 +209,7 @@ class AnnotationListWidget(QWidget):
         Args:
             item: Clicked list item
         """
-        annotation_id = item.data(Qt.ItemDataRole.UserRole)
+        annotation_id = item.data(_USER_ROLE)
         if annotation_id:
             self.annotation_selected.emit(annotation_id)
             self.edit_btn.setEnabled(True)
@@ -154,7 +219,7 @@ class AnnotationListWidget(QWidget):
         """Handle delete button click."""
         current_item = self.list_widget.currentItem()
         if current_item:
-            annotation_id = current_item.data(Qt.ItemDataRole.UserRole)
+            annotation_id = current_item.data(_USER_ROLE)
             if annotation_id:
                 self.annotation_deleted.emit(annotation_id)
 
@@ -162,7 +227,7 @@ class AnnotationListWidget(QWidget):
         """Handle edit button click."""
         current_item = self.list_widget.currentItem()
         if current_item:
-            annotation_id = current_item.data(Qt.ItemDataRole.UserRole)
+            annotation_id = current_item.data(_USER_ROLE)
             if annotation_id:
                 self.annotation_edit_requested.emit(annotation_id)
 
@@ -175,5 +240,5 @@ class AnnotationListWidget(QWidget):
         """
         current_item = self.list_widget.currentItem()
         if current_item:
-            return current_item.data(Qt.ItemDataRole.UserRole)
+            return current_item.data(_USER_ROLE)
         return None
@@ -8,9 +8,9 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QDialogButtonBox,
     QComboBox, QFileDialog, QSpinBox, QListWidget,
-    QListWidgetItem, QMessageBox
+    QListWidgetItem, QMessageBox, QCompleter, QPlainTextEdit
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
 from pathlib import Path
 from core.models import SubdirectoryConfig
 
@@ -40,6 +40,8 @@ class LabelSetupDialog(QDialog):
         self.setMinimumHeight(400)
 
         self.labels: dict[int, str] = {}
+        # Label names in use, kept in sync with self.labels for O(1) lookups
+        self._names: set[str] = set()
 
         layout = QVBoxLayout()
 
@@ -74,9 +76,21 @@ class LabelSetupDialog(QDialog):
 
         layout.addLayout(input_layout)
 
+        # Bulk entry: paste many "id,name" rows and import them in one pass
+        layout.addWidget(QLabel("Or paste labels, one \"ID,name\" per line:"))
+        self.bulk_input = QPlainTextEdit()
+        self.bulk_input.setPlaceholderText("1,cat\n2,dog\n3,person")
+        self.bulk_input.setMaximumHeight(80)
+        layout.addWidget(self.bulk_input)
+
+        import_btn = QPushButton("Import")
+        import_btn.clicked.connect(self._import_bulk)
+        layout.addWidget(import_btn)
+
         # Label list
         layout.addWidget(QLabel("Defined Labels:"))
         self.label_list = QListWidget()
+        self.label_list.setUniformItemSizes(True)  # Rows are single-line text
         layout.addWidget(self.label_list)
 
         # Remove button
@@ -116,7 +130,7 @@ class LabelSetupDialog(QDialog):
             return
 
         # Check if name already exists
-        if label_name in self.labels.values():
+        if label_name in self._names:
             QMessageBox.warning(
                 self,
                 "Duplicate Name",
@@ -125,14 +139,117 @@ class LabelSetupDialog(QDialog):
             return
 
         # Add to dictionary and list
-        self.labels[label_id] = label_name
-        self.label_list.addItem(f"{label_id}: {label_name}")
+        self.bulk_add_labels([(label_id, label_name)])
 
         # Auto-increment ID and clear name
         self.id_input.setValue(label_id + 1)
         self.name_input.clear()
         self.name_input.setFocus()
 
+    def reset_for_open(self, labels: dict[int, str]) -> None:
+        """
+        Repopulate the dialog for another showing without rebuilding widgets.
+
+        Args:
+            labels: Current label set {id: name} to pre-populate
+        """
+        self.labels = {}
+        self._names = set()
+        # Keep the emptied list from repainting before it is refilled
+        self.label_list.setUpdatesEnabled(False)
+        self.label_list.clear()
+        self.bulk_add_labels(sorted(labels.items()))
+
+        self.id_input.setValue(max(labels) + 1 if labels else 1)
+        self.name_input.clear()
+        self.bulk_input.clear()
+        self.name_input.setFocus()
+
+    def _import_bulk(self):
+        """
+        Import all "ID,name" rows from the bulk text box.
+
+        Valid rows are added in a single batch; problems with any rows are
+        reported together in one message box.
+        """
+        items: list[tuple[int, str]] = []
+        errors: list[str] = []
+        new_ids: set[int] = set()
+        new_names: set[str] = set()
+
+        for line_no, line in enumerate(self.bulk_input.toPlainText().splitlines(), start=1):
+            line = line.strip()
+            if not line:
+                continue
+
+            id_str, sep, label_name = line.partition(',')
+            label_name = label_name.strip()
+            if not sep or not label_name:
+                errors.append(f"Line {line_no}: expected \"ID,name\"")
+                continue
+
+            try:
+                label_id = int(id_str)
+            except ValueError:
+                errors.append(f"Line {line_no}: ID '{id_str.strip()}' is not an integer")
+                continue
+
+            if not self.id_input.minimum() <= label_id <= self.id_input.maximum():
+                errors.append(
+                    f"Line {line_no}: ID must be between "
+                    f"{self.id_input.minimum()} and {self.id_input.maximum()}"
+                )
+            elif label_id in self.labels or label_id in new_ids:
+                errors.append(f"Line {line_no}: label ID {label_id} already exists")
+            elif label_name in self._names or label_name in new_names:
+                errors.append(f"Line {line_no}: label '{label_name}' already exists")
+            else:
+                items.append((label_id, label_name))
+                new_ids.add(label_id)
+                new_names.add(label_name)
+
+        if items:
+            self.bulk_add_labels(items)
+            self.id_input.setValue(max(self.labels) + 1)
+
+        if errors:
+            QMessageBox.warning(
+                self,
+                "Import Problems",
+                f"Imported {len(items)} label(s). Skipped {len(errors)} row(s):\n"
+                + "\n".join(errors)
+            )
+        else:
+            self.bulk_input.clear()
+
+    def bulk_add_labels(self, items: list[tuple[int, str]]) -> None:
+        """
+        Add several labels at once.
+
+        The rows are inserted with one addItems call while list updates and
+        sorting are suspended, so the widget lays out once for the whole
+        batch. Items are not validated; callers must check for duplicate
+        IDs and names first.
+
+        Args:
+            items: (label_id, label_name) pairs to add, in display order
+        """
+        label_list = self.label_list
+        sorting = label_list.isSortingEnabled()
+        label_list.setUpdatesEnabled(False)
+        label_list.setSortingEnabled(False)
+        try:
+            texts = []
+            for label_id, label_name in items:
+                self.labels[label_id] = label_name
+                self._names.add(label_name)
+                texts.append(f"{label_id}: {label_name}")
+            label_list.addItems(texts)
+        finally:
+            label_list.setSortingEnabled(sorting)
+            # Re-enabling updates schedules the repaint
+            label_list.setUpdatesEnabled(True)
+
     def _remove_label(self):
         """Remove selected label from the set."""
         current_item = self.label_list.currentItem()
@@ -144,6 +261,7 @@ class LabelSetupDialog(QDialog):
         label_id = int(text.split(':')[0].strip())
 
         # Remove from dictionary and list
+        self._names.discard(self.labels[label_id])
         del self.labels[label_id]
         self.label_list.takeItem(self.label_list.row(current_item))
 
@@ -169,6 +287,51 @@ class LabelSetupDialog(QDialog):
         return self.labels.copy()
 
 
+class _LabelListModel(QAbstractListModel):
+    """
+    Read-only list model over sorted (label_id, label_name) pairs.
+
+    Item text is formatted on demand, so views only pay for the rows
+    they actually display instead of one widget item per label.
+    """
+
+    def __init__(self, labels: dict[int, str], parent=None):
+        """
+        Initialize the model.
+
+        Args:
+            labels: Dictionary of available labels {id: name}
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._items = sorted(labels.items())
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of labels (flat list, so no children)."""
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """
+        Get "ID: name" text for display/edit roles and the label ID for UserRole.
+
+        Args:
+            index: Row to read
+            role: Requested data role
+
+        Returns:
+            Role data, or None for unsupported roles / invalid rows
+        """
+        if not index.isValid():
+            return None
+
+        label_id, label_name = self._items[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return f"{label_id}: {label_name}"
+        if role == Qt.ItemDataRole.UserRole:
+            return label_id
+        return None
+
+
 class LabelSelectionDialog(QDialog):
     """
     Simple dropdown to select a label from the predefined set.
@@ -195,12 +358,32 @@ class LabelSelectionDialog(QDialog):
 
         self.labels = labels
 
+        # Case-folded "ID: name" item text and bare names -> label ID, built
+        # once so resolving the typed text is one dict lookup per keystroke.
+        # Item text wins over a bare name; the lowest ID wins among duplicates.
+        sorted_labels = sorted(labels.items())
+        self._label_lookup: dict[str, int] = {
+            f"{label_id}: {label_name}".casefold(): label_id
+            for label_id, label_name in sorted_labels
+        }
+        for label_id, label_name in sorted_labels:
+            self._label_lookup.setdefault(label_name.casefold(), label_id)
+
         layout = QVBoxLayout()
 
-        # Label selection
+        # Label selection, backed by a model so large label sets are not
+        # materialized as one combo item each
         self.label_combo = QComboBox()
-        for label_id, label_name in sorted(labels.items()):
-            self.label_combo.addItem(f"{label_id}: {label_name}", userData=label_id)
+        self.label_combo.setModel(_LabelListModel(labels, self.label_combo))
+        self.label_combo.view().setUniformItemSizes(True)
+
+        # Type to filter: popup shows labels containing the typed text
+        self.label_combo.setEditable(True)
+        self.label_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        completer = self.label_combo.completer()
+        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchFlag.MatchContains)
 
         layout.addWidget(QLabel("Select annotation label:"))
         layout.addWidget(self.label_combo)
@@ -214,22 +397,51 @@ class LabelSelectionDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+        # OK is only enabled while the typed text names a label
+        self._ok_button = buttons.button(QDialogButtonBox.StandardButton.Ok)
+        self.label_combo.editTextChanged.connect(self._update_ok_button)
+        self._update_ok_button()
+
         self.setLayout(layout)
 
         # Focus on combo box
         self.label_combo.setFocus()
 
+    def _resolve_label_id(self) -> int | None:
+        """
+        Find the label the combo's text refers to.
+
+        Accepts an item's full "ID: name" text or just a label name, both
+        matched case-insensitively.
+
+        Returns:
+            Label ID, or None if the text matches no label
+        """
+        return self._label_lookup.get(self.label_combo.currentText().strip().casefold())
+
+    def _update_ok_button(self) -> None:
+        """Enable OK only while the typed text resolves to a label."""
+        self._ok_button.setEnabled(self._resolve_label_id() is not None)
+
+    def accept(self):
+        """Accept only if the typed text resolves to a label."""
+        if self._resolve_label_id() is None:
+            return
+        super().accept()
+
     def get_selected_label(self) -> tuple[int, str] | None:
         """
         Get the selected label.
 
         Returns:
             Tuple of (label_id, label_name) if accepted, None if canceled
+            or the text matches no label
         """
         if self.result() == QDialog.DialogCode.Accepted:
-            label_id = self.label_combo.currentData()
-            label_name = self.labels[label_id]
-            return label_id, label_name
+            label_id = self._resolve_label_id()
+            if label_id is None:
+                return None
+            return label_id, self.labels[label_id]
         return None
 
 
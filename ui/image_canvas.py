@@ -6,9 +6,13 @@ draw bounding boxes, and see existing annotations.
 """
 
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QRect
-from PyQt6.QtGui import QPainter, QPen, QColor, QPixmap, QFont, QPaintEvent, QMouseEvent
-from core.models import BoundingBox, Annotation
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QObject, QPoint, QRect, QRunnable, QSize, QThreadPool, QTimer
+)
+from PyQt6.QtGui import (
+    QPainter, QPen, QColor, QImage, QPixmap, QFont, QFontMetrics, QPaintEvent, QMouseEvent
+)
+from core.models import BoundingBox, Annotation, point_in_box
 from utils.constants import (
     DEFAULT_BOX_COLOR,
     SELECTED_BOX_COLOR,
@@ -16,9 +20,82 @@ from utils.constants import (
     BOX_LINE_WIDTH,
     LABEL_FONT_SIZE,
     LABEL_BACKGROUND_ALPHA,
-    MIN_BOX_SIZE
+    MIN_BOX_SIZE,
+    RESIZE_SMOOTH_DELAY_MS,
+    ASYNC_SCALE_MIN_PIXELS
 )
 
+# Hit-testing grid: cell size in image pixels, and the annotation count
+# below which a plain linear scan is cheaper than building the grid
+_GRID_CELL_SIZE = 64
+_GRID_MIN_ANNOTATIONS = 32
+
+# Label text color
+_LABEL_TEXT_COLOR = QColor(255, 255, 255)
+
+# Canvas background (letterbox) color
+_BACKGROUND_COLOR = QColor(50, 50, 50)
+
+
+class _ScaleBridge(QObject):
+    """
+    Carries smooth-scaled images from pool threads back to the GUI thread.
+
+    Lives in the canvas's thread; signals emitted by worker threads are
+    therefore delivered to its slot as queued calls.
+    """
+
+    scaled = pyqtSignal(object, QImage)  # scale key, scaled image
+
+    def __init__(self, canvas: 'ImageCanvas'):
+        """
+        Initialize the bridge.
+
+        Args:
+            canvas: ImageCanvas that receives the results
+        """
+        super().__init__(canvas)
+        self._canvas = canvas
+        self.scaled.connect(self._on_scaled)
+
+    @pyqtSlot(object, QImage)
+    def _on_scaled(self, key: tuple, image: QImage) -> None:
+        """Forward a scaled image to the canvas."""
+        self._canvas._apply_smooth_scale(key, image)
+
+
+class _ScaleTask(QRunnable):
+    """
+    Smooth-scales one image on a QThreadPool thread.
+
+    Works on a QImage copy; QPixmap must only be touched on the GUI thread.
+    """
+
+    def __init__(self, key: tuple, image: QImage, size: QSize, bridge: _ScaleBridge):
+        """
+        Initialize the task.
+
+        Args:
+            key: Scale key identifying the request (see ImageCanvas._scaled_key)
+            image: Full-resolution source image
+            size: Target size to fit within
+            bridge: Bridge that receives the result
+        """
+        super().__init__()
+        self._key = key
+        self._image = image
+        self._size = size
+        self._bridge = bridge
+
+    def run(self) -> None:
+        """Scale the image and emit the result through the bridge."""
+        scaled = self._image.scaled(
+            self._size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        self._bridge.scaled.emit(self._key, scaled)
+
 
 class ImageCanvas(QWidget):
     """
@@ -55,23 +132,69 @@ class ImageCanvas(QWidget):
         self._pixmap: QPixmap | None = None
         self._scaled_pixmap: QPixmap | None = None
         self._current_annotations: list[Annotation] = []
+        # Image-space (x, y, width, height) per annotation, parallel to
+        # _current_annotations (None for annotations without a box)
+        self._image_rects: list[tuple[int, int, int, int] | None] = []
+        # (id, label, image rect) per annotation as last passed to set_annotations
+        self._ann_fingerprint: tuple | None = None
+        # Grid cell -> indices into _current_annotations (None = linear scan)
+        self._spatial_index: dict[tuple[int, int], list[int]] | None = None
+        # Widget-space (x, y, width, height) per annotation, parallel to
+        # _current_annotations (None for annotations without a box)
+        self._widget_rects: list[tuple[int, int, int, int] | None] = []
         self._image_offset_x = 0
         self._image_offset_y = 0
         self._scale_factor = 1.0
+        # (pixmap cacheKey, width, height, transformation) of _scaled_pixmap
+        self._scaled_key: tuple | None = None
+        # Scale key of the smooth rescale running in the background, if any
+        self._pending_scale_key: tuple | None = None
+        self._scale_bridge = _ScaleBridge(self)
+
+        # Smooth rescaling is deferred until resizing pauses
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_SMOOTH_DELAY_MS)
+        self._resize_timer.timeout.connect(self._finalize_scale)
 
         # Drawing state
         self._drawing_mode = 'draw'  # 'draw' or 'select'
         self._is_drawing = False
         self._start_point: QPoint | None = None
         self._current_point: QPoint | None = None
-        self._temp_box: BoundingBox | None = None
+        # Ready-to-draw temporary box in widget coords, updated on mouse input
+        self._temp_rect: QRect | None = None
+        # Widget area last covered by the temporary box, repainted on drag
+        self._last_temp_rect: QRect | None = None
 
         # Selection state
         self._selected_annotation_id: str | None = None
 
+        # Label font, built once and reused on every paint
+        self._label_font = QFont()
+        self._label_font.setPointSize(LABEL_FONT_SIZE)
+        self._label_font.setBold(True)
+        self._label_metrics = QFontMetrics(self._label_font, self)
+        # Box colors and pens, built once and reused on every paint
+        self._color_default = QColor(DEFAULT_BOX_COLOR)
+        self._color_selected = QColor(SELECTED_BOX_COLOR)
+        self._bg_default = QColor(self._color_default)
+        self._bg_default.setAlpha(LABEL_BACKGROUND_ALPHA)
+        self._bg_selected = QColor(self._color_selected)
+        self._bg_selected.setAlpha(LABEL_BACKGROUND_ALPHA)
+        self._pen_default = QPen(self._color_default, BOX_LINE_WIDTH)
+        self._pen_selected = QPen(self._color_selected, BOX_LINE_WIDTH)
+        self._pen_temp = QPen(QColor(TEMP_BOX_COLOR), BOX_LINE_WIDTH)
+        self._pen_temp.setStyle(Qt.PenStyle.DashLine)
+
+        # Pre-rendered label pixmaps keyed by (label name, selected)
+        self._label_sprite_cache: dict[tuple[str, bool], QPixmap] = {}
+
         # Widget settings
         self.setMinimumSize(400, 300)
         self.setMouseTracking(True)
+        # paintEvent covers every pixel, so Qt need not erase first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
 
     def set_image(self, pixmap: QPixmap) -> None:
         """
@@ -80,8 +203,13 @@ class ImageCanvas(QWidget):
         Args:
             pixmap: QPixmap to display
         """
+        # Same pixel data already shown - nothing to rescale or repaint
+        if self._pixmap is not None and pixmap.cacheKey() == self._pixmap.cacheKey():
+            return
+
         self._pixmap = pixmap
-        self._update_scaled_pixmap()
+        self._resize_timer.stop()
+        self._smooth_scale()
         self.update()  # Trigger repaint
 
     def set_annotations(self, annotations: list[Annotation]) -> None:
@@ -91,18 +219,155 @@ class ImageCanvas(QWidget):
         Args:
             annotations: List of Annotation objects to render
         """
-        self._current_annotations = annotations
+        # Own a copy so incremental add/remove can keep the parallel lists aligned
+        self._current_annotations = list(annotations)
+        image_rects = [
+            (box.x, box.y, box.width, box.height) if box else None
+            for box in (annotation.bounding_box for annotation in annotations)
+        ]
+
+        # Skip the rebuild and repaint when nothing visible has changed
+        fingerprint = tuple(
+            (annotation.id, annotation.label_name, rect)
+            for annotation, rect in zip(annotations, image_rects)
+        )
+        if fingerprint == self._ann_fingerprint:
+            return
+        self._ann_fingerprint = fingerprint
+
+        self._image_rects = image_rects
+        self._build_spatial_index()
+        self._recompute_widget_rects()
+
+        # Drop sprites for labels no longer on screen
+        label_names = {annotation.label_name for annotation in annotations}
+        if any(name not in label_names for name, _ in self._label_sprite_cache):
+            self._label_sprite_cache = {
+                key: sprite for key, sprite in self._label_sprite_cache.items()
+                if key[0] in label_names
+            }
+
         self.update()  # Trigger repaint
 
+    def add_annotation_item(self, annotation: Annotation) -> None:
+        """
+        Show one more annotation without rebuilding the others.
+
+        Args:
+            annotation: Annotation to add
+        """
+        box = annotation.bounding_box
+        rect = (box.x, box.y, box.width, box.height) if box else None
+
+        index = len(self._current_annotations)
+        self._current_annotations.append(annotation)
+        self._image_rects.append(rect)
+        self._widget_rects.append(self._image_to_widget_coords(rect) if rect is not None else None)
+        if self._spatial_index is not None and rect is not None:
+            self._index_annotation(self._spatial_index, index, rect)
+
+        # Contents no longer match any list passed to set_annotations
+        self._ann_fingerprint = None
+
+        dirty = self._annotation_widget_rect(annotation.id)
+        if dirty is not None:
+            self.update(dirty)
+
+    def remove_annotation_item(self, annotation_id: str) -> None:
+        """
+        Stop showing one annotation without rebuilding the others.
+
+        The slot is blanked rather than deleted so grid indices stay valid;
+        the next set_annotations call compacts the lists.
+
+        Args:
+            annotation_id: ID of annotation to remove
+        """
+        for index, annotation in enumerate(self._current_annotations):
+            if annotation.id == annotation_id and self._image_rects[index] is not None:
+                break
+        else:
+            return
+
+        dirty = self._annotation_widget_rect(annotation_id)
+        self._image_rects[index] = None
+        self._widget_rects[index] = None
+        self._ann_fingerprint = None
+        if self._selected_annotation_id == annotation_id:
+            self._selected_annotation_id = None
+
+        if dirty is not None:
+            self.update(dirty)
+
+    def _recompute_widget_rects(self) -> None:
+        """
+        Convert every annotation box to widget coordinates once.
+
+        Called whenever the annotations or the scale/offset change, so
+        paintEvent can draw without per-frame coordinate conversion.
+        """
+        to_widget = self._image_to_widget_coords
+        self._widget_rects = [
+            to_widget(rect) if rect is not None else None
+            for rect in self._image_rects
+        ]
+
+    def _build_spatial_index(self) -> None:
+        """
+        Bucket annotations into a uniform grid for point hit-testing.
+
+        Each box is registered in every cell it overlaps, so a point query
+        only has to look at the candidates in its own cell.
+        """
+        rects = self._image_rects
+        if len(rects) < _GRID_MIN_ANNOTATIONS:
+            self._spatial_index = None
+            return
+
+        grid: dict[tuple[int, int], list[int]] = {}
+        for i, rect in enumerate(rects):
+            if rect is not None:
+                self._index_annotation(grid, i, rect)
+
+        self._spatial_index = grid
+
+    @staticmethod
+    def _index_annotation(
+        grid: dict[tuple[int, int], list[int]],
+        index: int,
+        rect: tuple[int, int, int, int]
+    ) -> None:
+        """
+        Register one box in every grid cell it overlaps.
+
+        Args:
+            grid: Spatial index to update
+            index: Position of the annotation in _current_annotations
+            rect: Box (x, y, width, height) in image coordinates
+        """
+        x, y, width, height = rect
+        for cell_x in range(x // _GRID_CELL_SIZE, (x + width) // _GRID_CELL_SIZE + 1):
+            for cell_y in range(y // _GRID_CELL_SIZE, (y + height) // _GRID_CELL_SIZE + 1):
+                grid.setdefault((cell_x, cell_y), []).append(index)
+
     def clear(self) -> None:
         """Clear the canvas (remove image and annotations)."""
         self._pixmap = None
         self._scaled_pixmap = None
+        self._scaled_key = None
+        self._pending_scale_key = None
+        self._resize_timer.stop()
         self._current_annotations = []
-        self._temp_box = None
+        self._image_rects = []
+        self._ann_fingerprint = None
+        self._spatial_index = None
+        self._widget_rects = []
+        self._temp_rect = None
+        self._last_temp_rect = None
         self._selected_annotation_id = None
         self.update()
 
+    @pyqtSlot(str)
     def set_mode(self, mode: str) -> None:
         """
         Set the interaction mode.
@@ -114,25 +379,102 @@ class ImageCanvas(QWidget):
         self._is_drawing = False
         self._start_point = None
         self._current_point = None
+        self._temp_rect = None
+        self._last_temp_rect = None
 
     def resizeEvent(self, event):
-        """Handle widget resize by rescaling the image."""
+        """
+        Handle widget resize by rescaling the image.
+
+        Uses a fast rescale while the size is changing and schedules a
+        smooth rescale once resizing pauses.
+        """
         super().resizeEvent(event)
         if self._pixmap:
+            self._update_scaled_pixmap(Qt.TransformationMode.FastTransformation)
+            self._resize_timer.start()
+
+    def _finalize_scale(self) -> None:
+        """Redo the scaled pixmap with smooth filtering after a resize settles."""
+        if self._pixmap:
+            self._smooth_scale()
+            self.update()
+
+    def _smooth_scale(self) -> None:
+        """
+        Bring the scaled pixmap up to smooth quality for the current size.
+
+        Small images are scaled here directly. Oversized images get an
+        immediate fast rescale and a smooth one on a QThreadPool thread,
+        which replaces it when done unless the image or size has changed.
+        """
+        pixmap = self._pixmap
+        if pixmap.width() * pixmap.height() < ASYNC_SCALE_MIN_PIXELS:
             self._update_scaled_pixmap()
+            return
+
+        smooth = Qt.TransformationMode.SmoothTransformation
+        key = (pixmap.cacheKey(), self.width(), self.height(), smooth)
+        if key == self._scaled_key or key == self._pending_scale_key:
+            return
+
+        self._update_scaled_pixmap(Qt.TransformationMode.FastTransformation)
+        self._pending_scale_key = key
+        QThreadPool.globalInstance().start(
+            _ScaleTask(key, pixmap.toImage(), self.size(), self._scale_bridge)
+        )
 
-    def _update_scaled_pixmap(self) -> None:
-        """Update the scaled pixmap and calculate offset for centering."""
+    def _apply_smooth_scale(self, key: tuple, image: QImage) -> None:
+        """
+        Swap in a background smooth rescale if it still matches the display.
+
+        Args:
+            key: Scale key the result was computed for
+            image: Smooth-scaled image
+        """
+        if key == self._pending_scale_key:
+            self._pending_scale_key = None
+
+        # Discard results for a replaced image or an outdated widget size
+        pixmap = self._pixmap
+        smooth = Qt.TransformationMode.SmoothTransformation
+        if not pixmap or key != (pixmap.cacheKey(), self.width(), self.height(), smooth):
+            return
+
+        self._scaled_key = key
+        self._scaled_pixmap = QPixmap.fromImage(image)
+        self._update_geometry()
+        self.update()
+
+    def _update_scaled_pixmap(
+        self,
+        transformation: Qt.TransformationMode = Qt.TransformationMode.SmoothTransformation
+    ) -> None:
+        """
+        Update the scaled pixmap and calculate offset for centering.
+
+        Args:
+            transformation: Filtering used for scaling (default: smooth)
+        """
         if not self._pixmap:
             return
 
+        # Skip if the image, widget size and filtering are unchanged
+        key = (self._pixmap.cacheKey(), self.width(), self.height(), transformation)
+        if key == self._scaled_key:
+            return
+        self._scaled_key = key
+
         # Scale pixmap to fit widget while maintaining aspect ratio
         self._scaled_pixmap = self._pixmap.scaled(
             self.size(),
             Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
+            transformation
         )
+        self._update_geometry()
 
+    def _update_geometry(self) -> None:
+        """Recalculate centering offset and scale factor for the scaled pixmap."""
         # Calculate offset to center the image
         self._image_offset_x = (self.width() - self._scaled_pixmap.width()) // 2
         self._image_offset_y = (self.height() - self._scaled_pixmap.height()) // 2
@@ -141,6 +483,9 @@ class ImageCanvas(QWidget):
         if self._pixmap.width() > 0 and self._scaled_pixmap.width() > 0:
             self._scale_factor = self._pixmap.width() / self._scaled_pixmap.width()
 
+        # Widget-space boxes depend on the scale and offset just computed
+        self._recompute_widget_rects()
+
     def paintEvent(self, event: QPaintEvent) -> None:
         """
         Paint the canvas.
@@ -155,12 +500,16 @@ class ImageCanvas(QWidget):
         """
         painter = QPainter(self)
 
-        # Fill background
-        painter.fillRect(self.rect(), QColor(50, 50, 50))
-
         if not self._scaled_pixmap:
+            painter.fillRect(self.rect(), _BACKGROUND_COLOR)
             return
 
+        # Fill background (only the letterbox bands unless the image is translucent)
+        if self._scaled_pixmap.hasAlphaChannel():
+            painter.fillRect(self.rect(), _BACKGROUND_COLOR)
+        else:
+            self._fill_letterbox(painter)
+
         # Draw the scaled image
         painter.drawPixmap(
             self._image_offset_x,
@@ -168,40 +517,99 @@ class ImageCanvas(QWidget):
             self._scaled_pixmap
         )
 
-        # Draw all saved annotations
-        for annotation in self._current_annotations:
-            is_selected = (annotation.id == self._selected_annotation_id)
-            self._draw_annotation(painter, annotation, is_selected)
+        # Draw all saved annotations, skipping those outside the dirty area
+        dirty = event.rect()
+        cull = not dirty.contains(self.rect())
+        dirty_left = dirty.left()
+        dirty_top = dirty.top()
+        dirty_right = dirty.right() + 1
+        dirty_bottom = dirty.bottom() + 1
+
+        # Collect visible annotations, grouping boxes by pen
+        default_rects: list[QRect] = []
+        selected_rects: list[QRect] = []
+        labels: list[tuple[int, int, str, bool]] = []
+
+        selected_id = self._selected_annotation_id
+        for annotation, rect in zip(self._current_annotations, self._widget_rects):
+            if rect is None:
+                continue
+            selected = annotation.id == selected_id
+            if cull:
+                left, top, right, bottom = self._annotation_extent(rect, annotation.label_name, selected)
+                if right <= dirty_left or left >= dirty_right or bottom <= dirty_top or top >= dirty_bottom:
+                    continue
+            (selected_rects if selected else default_rects).append(QRect(*rect))
+            labels.append((rect[0], rect[1], annotation.label_name, selected))
+
+        # Draw bounding boxes, one call per pen
+        if default_rects:
+            painter.setPen(self._pen_default)
+            painter.drawRects(default_rects)
+        if selected_rects:
+            painter.setPen(self._pen_selected)
+            painter.drawRects(selected_rects)
+
+        # Draw labels on top of all boxes
+        for box_x, box_y, label, selected in labels:
+            self._draw_label(painter, box_x, box_y, label, selected)
 
         # Draw temporary box being drawn
-        if self._is_drawing and self._start_point and self._current_point:
+        if self._is_drawing and self._temp_rect is not None:
             self._draw_temporary_box(painter)
 
-    def _draw_annotation(self, painter: QPainter, annotation: Annotation, selected: bool) -> None:
+    def _annotation_extent(
+        self,
+        rect: tuple[int, int, int, int],
+        label: str,
+        selected: bool
+    ) -> tuple[int, int, int, int]:
         """
-        Draw a single annotation (bounding box + label).
+        Get the widget area an annotation paints, including outline and label.
 
         Args:
-            painter: QPainter instance
-            annotation: Annotation to draw
-            selected: Whether this annotation is selected
-        """
-        if not annotation.bounding_box:
-            return
+            rect: Box (x, y, width, height) in widget coordinates
+            label: Label text drawn above the box
+            selected: Whether the annotation is selected
 
-        # Convert image coordinates to widget coordinates
-        box = self._image_to_widget_coords(annotation.bounding_box)
-
-        # Choose color based on selection state
-        color = QColor(SELECTED_BOX_COLOR) if selected else QColor(DEFAULT_BOX_COLOR)
+        Returns:
+            (left, top, right, bottom) with exclusive right/bottom edges
+        """
+        x, y, width, height = rect
+        pad = BOX_LINE_WIDTH
+        label_width = int(self._get_label_sprite(label, selected).deviceIndependentSize().width())
+        label_height = self._label_metrics.height() + 4
+
+        return (
+            x - pad,
+            y - label_height - pad,  # Label sits above the box (or inside at the top)
+            max(x + width, x + label_width) + pad + 1,
+            y + height + pad + 1,
+        )
 
-        # Draw bounding box
-        pen = QPen(color, BOX_LINE_WIDTH)
-        painter.setPen(pen)
-        painter.drawRect(box.x, box.y, box.width, box.height)
+    def _fill_letterbox(self, painter: QPainter) -> None:
+        """
+        Fill the background bands around the centered image.
 
-        # Draw label background and text
-        self._draw_label(painter, box, annotation.label_name, color)
+        Args:
+            painter: QPainter instance
+        """
+        width = self.width()
+        height = self.height()
+        left = self._image_offset_x
+        top = self._image_offset_y
+        right = left + self._scaled_pixmap.width()
+        bottom = top + self._scaled_pixmap.height()
+
+        bands = (
+            (0, 0, width, top),                          # Above image
+            (0, bottom, width, height - bottom),         # Below image
+            (0, top, left, bottom - top),                # Left of image
+            (right, top, width - right, bottom - top),   # Right of image
+        )
+        for x, y, w, h in bands:
+            if w > 0 and h > 0:
+                painter.fillRect(x, y, w, h, _BACKGROUND_COLOR)
 
     def _draw_temporary_box(self, painter: QPainter) -> None:
         """
@@ -210,58 +618,69 @@ class ImageCanvas(QWidget):
         Args:
             painter: QPainter instance
         """
-        if not self._start_point or not self._current_point:
-            return
-
-        # Calculate box dimensions from two opposite corners
-        x = min(self._start_point.x(), self._current_point.x())
-        y = min(self._start_point.y(), self._current_point.y())
-        width = abs(self._current_point.x() - self._start_point.x())
-        height = abs(self._current_point.y() - self._start_point.y())
-
         # Draw temporary box in yellow with dashed line
-        pen = QPen(QColor(TEMP_BOX_COLOR), BOX_LINE_WIDTH)
-        pen.setStyle(Qt.PenStyle.DashLine)
-        painter.setPen(pen)
-        painter.drawRect(x, y, width, height)
+        painter.setPen(self._pen_temp)
+        painter.drawRect(self._temp_rect)
 
-    def _draw_label(self, painter: QPainter, box: BoundingBox, label: str, color: QColor) -> None:
+    def _draw_label(self, painter: QPainter, box_x: int, box_y: int, label: str, selected: bool) -> None:
         """
         Draw label text with background above the bounding box.
 
         Args:
             painter: QPainter instance
-            box: Bounding box (in widget coordinates)
+            box_x: Box left edge (in widget coordinates)
+            box_y: Box top edge (in widget coordinates)
             label: Label text to display
-            color: Color for the label background
+            selected: Whether the owning annotation is selected
+        """
+        sprite = self._get_label_sprite(label, selected)
+        label_height = self._label_metrics.height() + 4
+
+        # Position label above the box (or inside if box is at top)
+        label_y = box_y - label_height if box_y > label_height else box_y
+        painter.drawPixmap(box_x, label_y, sprite)
+
+    def _get_label_sprite(self, label: str, selected: bool) -> QPixmap:
         """
-        # Setup font
-        font = QFont()
-        font.setPointSize(LABEL_FONT_SIZE)
-        font.setBold(True)
-        painter.setFont(font)
+        Get the pre-rendered label (background + text), rendering it on first use.
+
+        Args:
+            label: Label text to display
+            selected: Whether the owning annotation is selected
+
+        Returns:
+            Translucent QPixmap sized to the label
+        """
+        key = (label, selected)
+        sprite = self._label_sprite_cache.get(key)
+        if sprite is not None:
+            return sprite
 
         # Calculate label dimensions
-        metrics = painter.fontMetrics()
+        metrics = self._label_metrics
         label_width = metrics.horizontalAdvance(label) + 8
         label_height = metrics.height() + 4
 
-        # Position label above the box (or inside if box is at top)
-        label_x = box.x
-        label_y = box.y - label_height if box.y > label_height else box.y
+        # Render at device resolution so text stays sharp on HiDPI screens
+        ratio = self.devicePixelRatioF()
+        sprite = QPixmap(round(label_width * ratio), round(label_height * ratio))
+        sprite.setDevicePixelRatio(ratio)
+        sprite.fill(Qt.GlobalColor.transparent)
 
         # Draw label background
-        bg_color = QColor(color)
-        bg_color.setAlpha(LABEL_BACKGROUND_ALPHA)
-        painter.fillRect(label_x, label_y, label_width, label_height, bg_color)
+        bg_color = self._bg_selected if selected else self._bg_default
+
+        sprite_painter = QPainter(sprite)
+        sprite_painter.fillRect(0, 0, label_width, label_height, bg_color)
 
         # Draw label text
-        painter.setPen(QColor(255, 255, 255))  # White text
-        painter.drawText(
-            label_x + 4,
-            label_y + metrics.ascent() + 2,
-            label
-        )
+        sprite_painter.setFont(self._label_font)
+        sprite_painter.setPen(_LABEL_TEXT_COLOR)  # White text
+        sprite_painter.drawText(4, metrics.ascent() + 2, label)
+        sprite_painter.end()
+
+        self._label_sprite_cache[key] = sprite
+        return sprite
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """
@@ -285,6 +704,8 @@ class ImageCanvas(QWidget):
             self._is_drawing = True
             self._start_point = event.pos()
             self._current_point = event.pos()
+            self._update_temp_rect()
+            self._last_temp_rect = None
 
         elif self._drawing_mode == 'select':
             # Try to select annotation at this point
@@ -295,13 +716,22 @@ class ImageCanvas(QWidget):
         Handle mouse move event.
 
         In draw mode: Update temporary box while dragging (second corner updates).
+        Only the area covered by the old and new temporary box is repainted.
 
         Args:
             event: Mouse event
         """
         if self._is_drawing and self._drawing_mode == 'draw':
             self._current_point = event.pos()
-            self.update()  # Trigger repaint to show temporary box
+            self._update_temp_rect()
+
+            new_rect = self._temp_box_rect()
+            if self._last_temp_rect is not None:
+                dirty = new_rect.united(self._last_temp_rect)
+            else:
+                dirty = new_rect
+            self._last_temp_rect = new_rect
+            self.update(dirty)  # Repaint only where the temporary box was/is
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """
@@ -329,8 +759,32 @@ class ImageCanvas(QWidget):
             # Clear temporary drawing state
             self._start_point = None
             self._current_point = None
+            self._temp_rect = None
+            self._last_temp_rect = None
             self.update()
 
+    def _update_temp_rect(self) -> None:
+        """Recompute the temporary box from the two drag corners."""
+        # Calculate box dimensions from two opposite corners
+        x = min(self._start_point.x(), self._current_point.x())
+        y = min(self._start_point.y(), self._current_point.y())
+        width = abs(self._current_point.x() - self._start_point.x())
+        height = abs(self._current_point.y() - self._start_point.y())
+
+        self._temp_rect = QRect(x, y, width, height)
+
+    def _temp_box_rect(self) -> QRect:
+        """
+        Get the widget area covered by the temporary box, including its outline.
+
+        Returns:
+            Rectangle padded by the line width so the pen stroke is repainted
+        """
+        # drawRect strokes one pixel past width/height, hence the extra +1
+        return self._temp_rect.adjusted(
+            -BOX_LINE_WIDTH, -BOX_LINE_WIDTH, BOX_LINE_WIDTH + 1, BOX_LINE_WIDTH + 1
+        )
+
     def _create_bounding_box(self, start: QPoint, end: QPoint) -> BoundingBox | None:
         """
         Create a BoundingBox from two opposite corners in widget coordinates.
@@ -365,22 +819,29 @@ class ImageCanvas(QWidget):
 
         return BoundingBox(x=x_img, y=y_img, width=width_img, height=height_img)
 
-    def _image_to_widget_coords(self, box: BoundingBox) -> BoundingBox:
+    def _image_to_widget_coords(self, rect: tuple[int, int, int, int]) -> tuple[int, int, int, int]:
         """
-        Convert bounding box from image coordinates to widget coordinates.
+        Convert a box from image coordinates to widget coordinates.
+
+        Works on plain (x, y, width, height) tuples so the conversion
+        allocates no model objects and does not depend on BoundingBox.
 
         Args:
-            box: BoundingBox in image coordinates
+            rect: (x, y, width, height) in image coordinates
 
         Returns:
-            BoundingBox in widget coordinates
+            (x, y, width, height) in widget coordinates
         """
-        x = int(box.x / self._scale_factor) + self._image_offset_x
-        y = int(box.y / self._scale_factor) + self._image_offset_y
-        width = int(box.width / self._scale_factor)
-        height = int(box.height / self._scale_factor)
-
-        return BoundingBox(x=x, y=y, width=width, height=height)
+        box_x, box_y, box_w, box_h = rect
+        # Divide rather than multiply by a cached reciprocal: x * (1 / s)
+        # can round just below x / s and truncate one pixel lower
+        scale = self._scale_factor
+        return (
+            int(box_x / scale) + self._image_offset_x,
+            int(box_y / scale) + self._image_offset_y,
+            int(box_w / scale),
+            int(box_h / scale),
+        )
 
     def _is_point_on_image(self, point: QPoint) -> bool:
         """
@@ -409,14 +870,63 @@ class ImageCanvas(QWidget):
         x_img = int((point.x() - self._image_offset_x) * self._scale_factor)
         y_img = int((point.y() - self._image_offset_y) * self._scale_factor)
 
-        # Find annotation containing this point
-        for annotation in self._current_annotations:
-            if annotation.bounding_box and annotation.bounding_box.contains_point(x_img, y_img):
-                self._selected_annotation_id = annotation.id
+        # Narrow the search to the point's grid cell when an index exists
+        rects = self._image_rects
+        if self._spatial_index is None:
+            candidates = range(len(rects))
+        else:
+            cell = (x_img // _GRID_CELL_SIZE, y_img // _GRID_CELL_SIZE)
+            candidates = self._spatial_index.get(cell, ())
+
+        # Find annotation containing this point (first in list order wins)
+        for i in candidates:
+            rect = rects[i]
+            if rect is not None and point_in_box(*rect, x_img, y_img):
+                annotation = self._current_annotations[i]
+                # Re-clicking the selected box needs no repaint but still
+                # emits, so a list showing another row follows the canvas
+                if annotation.id != self._selected_annotation_id:
+                    self._change_selection(annotation.id)
                 self.annotation_selected.emit(annotation.id)
-                self.update()
                 return
 
         # No annotation found - deselect
-        self._selected_annotation_id = None
-        self.update()
+        if self._selected_annotation_id is not None:
+            self._change_selection(None)
+
+    def _change_selection(self, annotation_id: str | None) -> None:
+        """
+        Update the selected annotation and repaint only the affected boxes.
+
+        Args:
+            annotation_id: Newly selected annotation ID, or None to deselect
+        """
+        dirty = QRect()
+        for old_or_new in (self._selected_annotation_id, annotation_id):
+            rect = self._annotation_widget_rect(old_or_new)
+            if rect is not None:
+                dirty = dirty.united(rect)
+
+        self._selected_annotation_id = annotation_id
+        if not dirty.isNull():
+            self.update(dirty)
+
+    def _annotation_widget_rect(self, annotation_id: str | None) -> QRect | None:
+        """
+        Get the widget area painted by an annotation (box, outline and label).
+
+        Args:
+            annotation_id: ID of an annotation on the canvas
+
+        Returns:
+            Painted area, or None if the annotation is not shown
+        """
+        if annotation_id is None:
+            return None
+
+        for annotation, rect in zip(self._current_annotations, self._widget_rects):
+            if annotation.id == annotation_id and rect is not None:
+                selected = annotation_id == self._selected_annotation_id
+                left, top, right, bottom = self._annotation_extent(rect, annotation.label_name, selected)
+                return QRect(left, top, right - left, bottom - top)
+        return None
@@ -7,10 +7,12 @@ and delegates business logic to the core layer.
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QMenuBar, QMenu, QStatusBar, QFileDialog, QMessageBox
+    QMenuBar, QMenu, QStatusBar, QFileDialog, QMessageBox, QProgressDialog
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThread, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QPixmap
 
+from functools import partial
 from pathlib import Path
 
 from core.annotation_manager import AnnotationManager
@@ -18,11 +20,158 @@ from core.image_manager import ImageManager
 from core.label_manager import LabelManager
 from core.export_service import ExportService
 from core.import_service import ImportService
+from core.models import ImageMetadata, SubdirectoryConfig
 from data.image_loader import ImageLoader
 from ui.image_canvas import ImageCanvas
 from ui.dialogs import LabelSetupDialog, LabelSelectionDialog, ExportDialog, SubdirectoryLoadDialog, EditLabelDialog
 from ui.annotation_list_widget import AnnotationListWidget
 from ui.toolbar import ToolBar
+from utils.constants import PREFETCH_COUNT, NAV_DEBOUNCE_MS, STATUS_COALESCE_MS, IMAGE_FILE_FILTER
+
+
+class _ImageLoadBatch:
+    """
+    Bookkeeping for one multi-file background load started by load_images.
+
+    Results are slotted by selection index so images are added to the
+    ImageManager in the order the user picked them, whatever order the
+    pool threads finish in.
+    """
+
+    def __init__(self, file_paths: list[str], progress: QProgressDialog):
+        """
+        Initialize the batch.
+
+        Args:
+            file_paths: Files being loaded, in selection order
+            progress: Progress dialog shown while the batch runs
+        """
+        self.file_paths = file_paths
+        self.progress = progress
+        self.results: list[ImageMetadata | None] = [None] * len(file_paths)
+        self.errors: list[tuple[str, str]] = []
+        self.remaining = len(file_paths)
+        self.finished = False
+        # Pixmap of the earliest-selected file loaded so far, which is the
+        # one displayed when the batch fills an empty ImageManager
+        self.first_index = len(file_paths)
+        self.first_pixmap: QPixmap | None = None
+
+
+class _SubdirLoadWorker(QObject):
+    """
+    Scans subdirectories and reads image headers on a QThread.
+
+    Only ImageLoader.load_metadata_only is used, which reads image sizes
+    without decoding pixels or touching QPixmap. Results are emitted
+    per file and added to the ImageManager by slots on the GUI thread.
+    """
+
+    progress = pyqtSignal(int, int)         # files processed, total files
+    file_loaded = pyqtSignal(str, object)   # file_path, ImageMetadata
+    finished = pyqtSignal(int)              # number of images loaded
+    failed = pyqtSignal(str)                # error message
+
+    def __init__(self, config: SubdirectoryConfig, image_loader: ImageLoader):
+        """
+        Initialize the worker.
+
+        Args:
+            config: Subdirectories to load
+            image_loader: Loader used to read image metadata
+        """
+        super().__init__()
+        self._config = config
+        self._image_loader = image_loader
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Ask the worker to stop after the current file (callable from any thread)."""
+        self._cancelled = True
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """Load metadata for every image, emitting progress along the way."""
+        try:
+            candidates = ImageManager.find_subdirectory_images(self._config)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+
+        total = len(candidates)
+        loaded_count = 0
+        for done, (relative_path, path) in enumerate(candidates, start=1):
+            if self._cancelled:
+                break
+
+            try:
+                metadata = self._image_loader.load_metadata_only(path)
+            except Exception as e:
+                # Skip files that can't be loaded
+                print(f"Warning: Could not load {path}: {e}")
+            else:
+                # Store relative path in filename for COCO export
+                metadata.filename = relative_path
+                self.file_loaded.emit(path, metadata)
+                loaded_count += 1
+
+            self.progress.emit(done, total)
+
+        self.finished.emit(loaded_count)
+
+
+class _ExportSignals(QObject):
+    """Signals reporting the progress and outcome of an _ExportTask."""
+
+    progress = pyqtSignal(int)   # annotations written so far
+    done = pyqtSignal(dict)      # export statistics
+    failed = pyqtSignal(str)     # error message
+
+
+class _ExportTask(QRunnable):
+    """
+    Runs an ExportService export on a QThreadPool thread.
+
+    Only reads the ImageMetadata objects; the caller keeps them unchanged
+    (the progress dialog is window-modal) until done or failed fires.
+    """
+
+    def __init__(
+        self,
+        export_service: ExportService,
+        images: list[ImageMetadata],
+        export_format: str,
+        file_path: str
+    ):
+        """
+        Initialize the task.
+
+        Args:
+            export_service: Service performing the export
+            images: Images to export
+            export_format: 'csv' or 'coco'
+            file_path: Output file path
+        """
+        super().__init__()
+        self.signals = _ExportSignals()
+        self._export_service = export_service
+        self._images = images
+        self._export_format = export_format
+        self._file_path = file_path
+
+    def run(self) -> None:
+        """Export the images and emit the statistics or the error."""
+        try:
+            if self._export_format == "csv":
+                self._export_service.export_to_csv(
+                    self._images, self._file_path, self.signals.progress.emit
+                )
+            else:  # coco
+                self._export_service.export_to_coco(self._images, self._file_path)
+
+            self.signals.done.emit(self._export_service.get_export_stats(self._images))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
 
 
 class MainWindow(QMainWindow):
@@ -53,8 +202,48 @@ class MainWindow(QMainWindow):
         self.export_service = ExportService()
         self.import_service = ImportService()
 
-        # Initialize data layer
-        self.image_loader = ImageLoader()
+        # Initialize data layer (LRU pixmap cache so revisits skip decoding)
+        self.image_loader = ImageLoader(cache_enabled=True)
+
+        # Last navigation direction (+1 next, -1 previous), used for prefetching
+        self._nav_direction = 1
+
+        # Arrow-key navigation moves the index at once but displays only
+        # once keys pause, so auto-repeat skips intermediate decodes
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(NAV_DEBOUNCE_MS)
+        self._nav_timer.timeout.connect(self._apply_pending_nav)
+
+        # Status messages from hot paths (navigation, selection, annotation
+        # edits) are coalesced so a burst repaints the status bar once
+        self._pending_status: str | None = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_COALESCE_MS)
+        self._status_timer.timeout.connect(self._flush_status)
+
+        # Dialogs are built on first use and reused afterwards
+        self._label_dialog: LabelSetupDialog | None = None
+        self._export_dialog: ExportDialog | None = None
+        self._subdir_dialog: SubdirectoryLoadDialog | None = None
+
+        # Background subdirectory load, if one is running
+        self._subdir_thread: QThread | None = None
+        self._subdir_worker: _SubdirLoadWorker | None = None
+        self._subdir_progress: QProgressDialog | None = None
+        self._subdir_config: SubdirectoryConfig | None = None
+
+        # (image id, annotation_rev) last shown on the canvas and list
+        self._last_displayed_id: str | None = None
+        self._last_annotation_rev = -1
+
+        # Background export, if one is running. Exports get their own pool so
+        # closeEvent can wait for them without waiting on image decodes.
+        self._export_pool = QThreadPool(self)
+        self._export_pool.setMaxThreadCount(1)
+        self._export_progress: QProgressDialog | None = None
+        self._export_path: str | None = None
 
         # UI components (will be created in _init_ui)
         self.canvas: ImageCanvas | None = None
@@ -144,46 +333,47 @@ class MainWindow(QMainWindow):
 
     def _connect_signals(self) -> None:
         """Connect signals from UI components to handlers."""
+        # Every sender and receiver here lives on the GUI thread, so connect
+        # directly and skip AutoConnection's per-emit thread-affinity check.
+        # Worker-thread signals are connected where the workers are created.
+        direct = Qt.ConnectionType.DirectConnection
+
         # Canvas signals
         if self.canvas:
-            self.canvas.annotation_created.connect(self._on_annotation_created)
-            self.canvas.annotation_selected.connect(self._on_annotation_selected)
+            self.canvas.annotation_created.connect(self._on_annotation_created, direct)
+            # One slot updates the status bar and syncs the list selection
+            self.canvas.annotation_selected.connect(self._on_canvas_annotation_selected, direct)
 
         # Toolbar signals
         if self.toolbar:
-            self.toolbar.next_image_requested.connect(self._next_image)
-            self.toolbar.previous_image_requested.connect(self._previous_image)
-            self.toolbar.mode_changed.connect(self.canvas.set_mode)
+            self.toolbar.next_image_requested.connect(self._next_image, direct)
+            self.toolbar.previous_image_requested.connect(self._previous_image, direct)
+            self.toolbar.mode_changed.connect(self.canvas.set_mode, direct)
 
         # Annotation list signals
         if self.annotation_list:
-            self.annotation_list.annotation_deleted.connect(self._on_annotation_deleted_from_list)
-            self.annotation_list.annotation_selected.connect(self._on_annotation_selected)
-            self.annotation_list.annotation_edit_requested.connect(self._on_edit_label_requested)
-            # Bidirectional sync: canvas selection → list selection
-            self.canvas.annotation_selected.connect(self.annotation_list.select_annotation)
+            self.annotation_list.annotation_deleted.connect(self._on_annotation_deleted_from_list, direct)
+            self.annotation_list.annotation_selected.connect(self._on_annotation_selected, direct)
+            self.annotation_list.annotation_edit_requested.connect(self._on_edit_label_requested, direct)
 
+    @pyqtSlot()
     def _show_label_setup_dialog(self) -> None:
         """
         Show the label setup dialog.
 
         This allows users to define the label set before annotation begins.
         """
-        dialog = LabelSetupDialog(self)
+        if self._label_dialog is None:
+            self._label_dialog = LabelSetupDialog(self)
+        dialog = self._label_dialog
 
         # Pre-populate with existing labels if any
-        if self.label_manager.has_labels():
-            existing_labels = self.label_manager.get_all_labels()
-            dialog.labels = existing_labels.copy()
-            # Update the list widget
-            dialog.label_list.clear()
-            for label_id, label_name in sorted(existing_labels.items()):
-                dialog.label_list.addItem(f"{label_id}: {label_name}")
+        dialog.reset_for_open(self.label_manager.get_all_labels())
 
         if dialog.exec():
             labels = dialog.get_labels()
             self.label_manager.set_labels(labels)
-            self.status_bar.showMessage(
+            self._show_status(
                 f"Label set defined: {len(labels)} labels"
             )
         elif not self.label_manager.has_labels():
@@ -195,6 +385,7 @@ class MainWindow(QMainWindow):
                 "Use File → Define Labels to set up your label set."
             )
 
+    @pyqtSlot()
     def load_images(self) -> None:
         """
         Load images via file dialog.
@@ -217,39 +408,130 @@ class MainWindow(QMainWindow):
             self,
             "Select Images",
             "",
-            "Images (*.jpg *.jpeg *.png *.bmp *.gif)"
+            IMAGE_FILE_FILTER
         )
 
         if not file_paths:
             return
 
-        # Load each image
-        loaded_count = 0
-        for file_path in file_paths:
-            try:
-                # Load image and extract metadata
-                pixmap, metadata = self.image_loader.load_image(file_path)
+        # Decode on pool threads; results arrive as queued calls on this thread
+        progress = QProgressDialog("Loading images...", "Cancel", 0, len(file_paths), self)
+        progress.setWindowTitle("Load Images")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        # Show at once so the window takes no input while the batch runs
+        progress.setMinimumDuration(0)
+        progress.show()
+
+        batch = _ImageLoadBatch(file_paths, progress)
+        progress.canceled.connect(partial(self._finish_image_load, batch))
+        self._show_status(f"Loading {len(file_paths)} image(s)...")
+
+        for index, file_path in enumerate(file_paths):
+            self.image_loader.load_image_async(
+                file_path,
+                partial(self._on_image_loaded, batch, index),
+                partial(self._on_image_load_failed, batch, file_path)
+            )
 
-                # Add to image manager
-                self.image_manager.add_image(file_path, metadata)
-                loaded_count += 1
+    def _on_image_loaded(self, batch: _ImageLoadBatch, index: int, pixmap, metadata: ImageMetadata) -> None:
+        """
+        Record one successfully loaded image of a load_images batch.
 
-            except Exception as e:
-                QMessageBox.warning(
-                    self,
-                    "Error Loading Image",
-                    f"Failed to load {file_path}:\n{str(e)}"
-                )
+        Args:
+            batch: Batch the image belongs to
+            index: Position of the file in the user's selection
+            pixmap: Decoded pixmap
+            metadata: Metadata for the loaded image
+        """
+        if batch.finished:
+            return
+        batch.results[index] = metadata
+        if index < batch.first_index:
+            batch.first_index = index
+            batch.first_pixmap = pixmap
+        self._advance_image_load(batch)
+
+    def _on_image_load_failed(self, batch: _ImageLoadBatch, file_path: str, message: str) -> None:
+        """
+        Record one failed file of a load_images batch.
 
-        # Display first image if any were loaded
+        Args:
+            batch: Batch the file belongs to
+            file_path: File that failed to load
+            message: Error description
+        """
+        if batch.finished:
+            return
+        batch.errors.append((file_path, message))
+        self._advance_image_load(batch)
+
+    def _advance_image_load(self, batch: _ImageLoadBatch) -> None:
+        """Update progress and finish the batch once every file has reported."""
+        batch.remaining -= 1
+        batch.progress.setValue(len(batch.file_paths) - batch.remaining)
+        if batch.remaining == 0:
+            self._finish_image_load(batch)
+
+    def _finish_image_load(self, batch: _ImageLoadBatch) -> None:
+        """
+        Add the loaded images and report the outcome of a load_images batch.
+
+        Also called when the user cancels; images loaded so far are kept
+        and results still in flight are ignored.
+
+        Args:
+            batch: Batch to finish
+        """
+        if batch.finished:
+            return
+        batch.finished = True
+        batch.progress.reset()
+        batch.progress.deleteLater()
+
+        # Add to image manager in selection order
+        loaded_count = 0
+        for metadata in batch.results:
+            if metadata is not None:
+                self.image_manager.add_image(metadata.file_path, metadata)
+                loaded_count += 1
+
+        # Display first image if any were loaded, reusing its decoded pixmap
+        # in case later loads in the batch evicted it from the cache
         if loaded_count > 0:
+            current_image = self.image_manager.current_image
+            if batch.first_pixmap is not None and current_image is not None:
+                first_path = batch.file_paths[batch.first_index]
+                if current_image.file_path == first_path:
+                    self.image_loader.cache_pixmap(first_path, batch.first_pixmap)
+            batch.first_pixmap = None
+
             self._display_current_image()
-            self.status_bar.showMessage(
+            self._show_status(
                 f"Loaded {loaded_count} image(s)"
             )
         else:
-            self.status_bar.showMessage("No images loaded")
+            self._show_status("No images loaded")
+
+        # Report all failures together instead of one dialog per file, once
+        # the first image has been painted
+        if batch.errors:
+            QTimer.singleShot(0, partial(self._report_load_errors, batch.errors))
 
+    def _report_load_errors(self, errors: list[tuple[str, str]]) -> None:
+        """
+        Show one warning summarizing the files a load_images batch skipped.
+
+        Args:
+            errors: (file path, error message) pairs, listed under "Show Details"
+        """
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Icon.Warning)
+        msg.setWindowTitle("Error Loading Images")
+        msg.setText(f"Failed to load {len(errors)} image(s).")
+        msg.setDetailedText("\n".join(f"{path}: {message}" for path, message in errors))
+        msg.exec()
+
+    @pyqtSlot()
     def load_from_subdirectories(self) -> None:
         """
         Load images from multiple subdirectories.
@@ -268,8 +550,14 @@ class MainWindow(QMainWindow):
             if not self.label_manager.has_labels():
                 return
 
-        # Show subdirectory selection dialog
-        dialog = SubdirectoryLoadDialog(self)
+        # One subdirectory load at a time; its thread state is per-window
+        if self._subdir_thread is not None:
+            return
+
+        # Show subdirectory selection dialog (keeps the previous selection)
+        if self._subdir_dialog is None:
+            self._subdir_dialog = SubdirectoryLoadDialog(self)
+        dialog = self._subdir_dialog
         if not dialog.exec():
             return
 
@@ -277,44 +565,128 @@ class MainWindow(QMainWindow):
         if not config:
             return
 
-        try:
-            # Show progress message
-            self.status_bar.showMessage("Loading images from subdirectories...")
+        # Read image headers on a worker thread; images are added on this thread
+        self._show_status("Loading images from subdirectories...")
+        self.image_manager.set_base_path(config.base_path)
+
+        progress = QProgressDialog("Loading images from subdirectories...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Load from Subdirectories")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        # Show at once so the window takes no input while the worker runs
+        progress.setMinimumDuration(0)
+        progress.show()
+
+        thread = QThread(self)
+        worker = _SubdirLoadWorker(config, self.image_loader)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.progress.connect(self._on_subdir_progress)
+        worker.file_loaded.connect(self._on_subdir_file_loaded)
+        worker.finished.connect(self._on_subdir_load_finished)
+        worker.failed.connect(self._on_subdir_load_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(self._on_subdir_thread_finished)
+        # The worker's own event loop is busy in run(), so cancel directly
+        progress.canceled.connect(worker.cancel, Qt.ConnectionType.DirectConnection)
+
+        self._subdir_thread = thread
+        self._subdir_worker = worker
+        self._subdir_progress = progress
+        self._subdir_config = config
+        thread.start()
+
+    @pyqtSlot(int, int)
+    def _on_subdir_progress(self, done: int, total: int) -> None:
+        """
+        Update the subdirectory load progress dialog.
 
-            # Load images from subdirectories
-            loaded_count = self.image_manager.load_from_subdirectories(
-                config,
-                self.image_loader
-            )
+        Args:
+            done: Files processed so far
+            total: Total files found
+        """
+        if self._subdir_progress is not None:
+            self._subdir_progress.setMaximum(total)
+            self._subdir_progress.setValue(done)
 
-            if loaded_count > 0:
-                self._display_current_image()
-                QMessageBox.information(
-                    self,
-                    "Load Successful",
-                    f"Loaded {loaded_count} image(s) from subdirectories.\n\n"
-                    f"Base path: {config.base_path}\n"
-                    f"Subdirectories: {', '.join(config.subdirectories)}"
-                )
-                self.status_bar.showMessage(
-                    f"Loaded {loaded_count} image(s) from subdirectories"
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "No Images",
-                    "No supported images found in specified subdirectories."
-                )
-                self.status_bar.showMessage("No images loaded")
+    @pyqtSlot(str, object)
+    def _on_subdir_file_loaded(self, file_path: str, metadata: ImageMetadata) -> None:
+        """
+        Add one image found by the subdirectory worker.
 
-        except Exception as e:
-            QMessageBox.critical(
+        Args:
+            file_path: Absolute path to the image file
+            metadata: Metadata read from the image header
+        """
+        self.image_manager.add_image(file_path, metadata)
+
+    @pyqtSlot(int)
+    def _on_subdir_load_finished(self, loaded_count: int) -> None:
+        """
+        Report the outcome of a subdirectory load.
+
+        Args:
+            loaded_count: Number of images added
+        """
+        config = self._subdir_config
+        self._close_subdir_progress()
+
+        if loaded_count > 0:
+            self._display_current_image()
+            QMessageBox.information(
                 self,
-                "Load Failed",
-                f"Failed to load images from subdirectories:\n{str(e)}"
+                "Load Successful",
+                f"Loaded {loaded_count} image(s) from subdirectories.\n\n"
+                f"Base path: {config.base_path}\n"
+                f"Subdirectories: {', '.join(config.subdirectories)}"
+            )
+            self._show_status(
+                f"Loaded {loaded_count} image(s) from subdirectories"
             )
-            self.status_bar.showMessage("Load failed")
+        else:
+            QMessageBox.warning(
+                self,
+                "No Images",
+                "No supported images found in specified subdirectories."
+            )
+            self._show_status("No images loaded")
+
+    @pyqtSlot(str)
+    def _on_subdir_load_failed(self, message: str) -> None:
+        """
+        Report a subdirectory load that could not run.
 
+        Args:
+            message: Error description
+        """
+        self._close_subdir_progress()
+        QMessageBox.critical(
+            self,
+            "Load Failed",
+            f"Failed to load images from subdirectories:\n{message}"
+        )
+        self._show_status("Load failed")
+
+    def _close_subdir_progress(self) -> None:
+        """Dismiss the subdirectory load progress dialog."""
+        if self._subdir_progress is not None:
+            self._subdir_progress.reset()
+            self._subdir_progress.deleteLater()
+            self._subdir_progress = None
+        self._subdir_config = None
+
+    @pyqtSlot()
+    def _on_subdir_thread_finished(self) -> None:
+        """Release the subdirectory worker and its thread once the thread stops."""
+        if self._subdir_worker is not None:
+            self._subdir_worker.deleteLater()
+            self._subdir_worker = None
+        if self._subdir_thread is not None:
+            self._subdir_thread.deleteLater()
+            self._subdir_thread = None
+
+    @pyqtSlot()
     def import_annotations(self) -> None:
         """
         Import annotations from COCO JSON file.
@@ -355,7 +727,7 @@ class MainWindow(QMainWindow):
 
         try:
             # Import annotations
-            self.status_bar.showMessage("Importing annotations...")
+            self._show_status("Importing annotations...")
 
             imported_images, label_map = self.import_service.import_from_coco(
                 coco_path,
@@ -369,7 +741,7 @@ class MainWindow(QMainWindow):
                     "No images could be matched from the COCO JSON file.\n"
                     "Please check the image paths and base directory."
                 )
-                self.status_bar.showMessage("Import failed - no images matched")
+                self._show_status("Import failed - no images matched")
                 return
 
             # Update LabelManager with imported labels
@@ -392,7 +764,7 @@ class MainWindow(QMainWindow):
                 # Register annotations with AnnotationManager
                 for annotation in img_metadata.annotations:
                     annotation.image_id = img_metadata.id
-                    self.annotation_manager._annotations[annotation.id] = annotation
+                    self.annotation_manager.add_annotation(annotation)
                     total_annotations += 1
 
                 loaded_count += 1
@@ -414,7 +786,7 @@ class MainWindow(QMainWindow):
                     message
                 )
 
-                self.status_bar.showMessage(
+                self._show_status(
                     f"Imported {loaded_count} images, {total_annotations} annotations"
                 )
 
@@ -424,7 +796,7 @@ class MainWindow(QMainWindow):
                 "File Not Found",
                 f"COCO JSON file not found:\n{str(e)}"
             )
-            self.status_bar.showMessage("Import failed - file not found")
+            self._show_status("Import failed - file not found")
 
         except ValueError as e:
             QMessageBox.critical(
@@ -432,7 +804,7 @@ class MainWindow(QMainWindow):
                 "Invalid Format",
                 f"Invalid COCO JSON format:\n{str(e)}"
             )
-            self.status_bar.showMessage("Import failed - invalid format")
+            self._show_status("Import failed - invalid format")
 
         except Exception as e:
             QMessageBox.critical(
@@ -440,29 +812,36 @@ class MainWindow(QMainWindow):
                 "Import Failed",
                 f"Failed to import annotations:\n{str(e)}"
             )
-            self.status_bar.showMessage("Import failed")
+            self._show_status("Import failed")
 
     def _display_current_image(self) -> None:
         """Display the current image and its annotations."""
-        current_image = self.image_manager.get_current_image()
+        current_image = self.image_manager.current_image
 
         if not current_image:
+            self._last_displayed_id = None
             self.canvas.clear()
             self.annotation_list.clear()
             self.toolbar.update_image_counter(0, 0)
-            self.status_bar.showMessage("No images loaded")
+            self._show_status("No images loaded")
             return
 
         try:
-            # Load pixmap
-            pixmap, _ = self.image_loader.load_image(current_image.file_path)
+            # Skip the image/annotation pipeline if this exact state is shown
+            if (current_image.id != self._last_displayed_id
+                    or current_image.annotation_rev != self._last_annotation_rev):
+                # Load pixmap (cache hit if visited or prefetched recently)
+                pixmap = self._get_pixmap(current_image.file_path)
 
-            # Display on canvas
-            self.canvas.set_image(pixmap)
-            self.canvas.set_annotations(current_image.annotations)
+                # Display on canvas
+                self.canvas.set_image(pixmap)
+                self.canvas.set_annotations(current_image.annotations)
 
-            # Update annotation list
-            self.annotation_list.set_annotations(current_image.annotations)
+                # Update annotation list
+                self.annotation_list.set_annotations(current_image.annotations)
+
+                self._last_displayed_id = current_image.id
+                self._last_annotation_rev = current_image.annotation_rev
 
             # Update toolbar counter
             current_idx = self.image_manager.get_current_index()
@@ -470,11 +849,14 @@ class MainWindow(QMainWindow):
             self.toolbar.update_image_counter(current_idx, total)
 
             # Update status bar
-            self.status_bar.showMessage(
+            self._set_status_deferred(
                 f"Image {current_idx + 1}/{total}: {current_image.filename} "
                 f"({len(current_image.annotations)} annotations)"
             )
 
+            # Warm the cache once this image is on screen
+            QTimer.singleShot(0, self._prefetch_neighbors)
+
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -482,6 +864,25 @@ class MainWindow(QMainWindow):
                 f"Failed to display image:\n{str(e)}"
             )
 
+    def _get_pixmap(self, file_path: str) -> QPixmap:
+        """
+        Get the pixmap for an image, from the loader's LRU cache when possible.
+
+        Args:
+            file_path: Path to the image file
+
+        Returns:
+            Decoded QPixmap
+        """
+        pixmap, _ = self.image_loader.load_image(file_path)
+        return pixmap
+
+    def _prefetch_neighbors(self) -> None:
+        """Decode the next images in the current navigation direction in the background."""
+        upcoming = self.image_manager.get_images_ahead(PREFETCH_COUNT, self._nav_direction)
+        self.image_loader.prefetch([image.file_path for image in upcoming])
+
+    @pyqtSlot(object)
     def _on_annotation_created(self, box) -> None:
         """
         Handle annotation created signal from canvas.
@@ -491,7 +892,13 @@ class MainWindow(QMainWindow):
         Args:
             box: BoundingBox from the canvas
         """
-        current_image = self.image_manager.get_current_image()
+        # The box was drawn over the displayed image; if a queued navigation
+        # has already moved the manager on, it belongs to no current image
+        if self._flush_pending_nav():
+            self._show_status("Image changed while drawing - box discarded")
+            return
+
+        current_image = self.image_manager.current_image
         if not current_image:
             return
 
@@ -515,15 +922,13 @@ class MainWindow(QMainWindow):
                         label_name
                     )
 
-                    # Add to image metadata
+                    # Add to image metadata and patch the views
                     current_image.add_annotation(annotation)
-
-                    # Refresh display
-                    self.canvas.set_annotations(current_image.annotations)
-                    self.annotation_list.set_annotations(current_image.annotations)
+                    self.canvas.add_annotation_item(annotation)
+                    self.annotation_list.add_annotation(annotation)
 
                     # Update status
-                    self.status_bar.showMessage(
+                    self._set_status_deferred(
                         f"Created annotation: {label_name} "
                         f"({len(current_image.annotations)} total)"
                     )
@@ -535,16 +940,32 @@ class MainWindow(QMainWindow):
                         f"Failed to create annotation:\n{str(e)}"
                     )
 
-    def _on_annotation_selected(self, annotation_id: str) -> None:
+    @pyqtSlot(str)
+    def _on_canvas_annotation_selected(self, annotation_id: str) -> None:
         """
         Handle annotation selected signal from canvas.
 
+        Fans out to the status bar and the list selection (canvas → list
+        sync) from a single connection.
+
+        Args:
+            annotation_id: ID of selected annotation
+        """
+        self._on_annotation_selected(annotation_id)
+        if self.annotation_list:
+            self.annotation_list.select_annotation(annotation_id)
+
+    @pyqtSlot(str)
+    def _on_annotation_selected(self, annotation_id: str) -> None:
+        """
+        Handle annotation selected signal from canvas or list.
+
         Args:
             annotation_id: ID of selected annotation
         """
         annotation = self.annotation_manager.get_annotation(annotation_id)
         if annotation:
-            self.status_bar.showMessage(
+            self._set_status_deferred(
                 f"Selected: {annotation.label_name} (ID: {annotation_id[:8]}...)"
             )
 
@@ -557,48 +978,98 @@ class MainWindow(QMainWindow):
         """
         # Navigate between images with arrow keys
         if event.key() == Qt.Key.Key_Right or event.key() == Qt.Key.Key_Down:
-            self._next_image()
+            self._queue_navigation(1)
         elif event.key() == Qt.Key.Key_Left or event.key() == Qt.Key.Key_Up:
-            self._previous_image()
+            self._queue_navigation(-1)
         elif event.key() == Qt.Key.Key_Delete:
             self._delete_selected_annotation()
         else:
             super().keyPressEvent(event)
 
+    def _queue_navigation(self, direction: int) -> None:
+        """
+        Move to the next/previous image and schedule a debounced display.
+
+        Args:
+            direction: +1 for next, -1 for previous
+        """
+        self._nav_direction = direction
+        if direction > 0:
+            moved = self.image_manager.next_image()
+        else:
+            moved = self.image_manager.previous_image()
+        if not moved:
+            return
+
+        # Keep the counter current while the display is deferred
+        self.toolbar.update_image_counter(
+            self.image_manager.get_current_index(),
+            self.image_manager.get_image_count()
+        )
+        self._nav_timer.start()
+
+    @pyqtSlot()
+    def _apply_pending_nav(self) -> None:
+        """Display the image reached by queued arrow-key navigation."""
+        self._display_current_image()
+
+    def _flush_pending_nav(self) -> bool:
+        """
+        Display a queued navigation now instead of when the debounce ends.
+
+        Called before annotation changes so the canvas and list show the
+        image the ImageManager considers current.
+
+        Returns:
+            True if a navigation was pending (the displayed image changed)
+        """
+        if not self._nav_timer.isActive():
+            return False
+        self._nav_timer.stop()
+        self._apply_pending_nav()
+        return True
+
+    @pyqtSlot()
     def _next_image(self) -> None:
         """Navigate to the next image."""
+        self._nav_direction = 1
         next_img = self.image_manager.next_image()
         if next_img:
             self._display_current_image()
 
+    @pyqtSlot()
     def _previous_image(self) -> None:
         """Navigate to the previous image."""
+        self._nav_direction = -1
         prev_img = self.image_manager.previous_image()
         if prev_img:
             self._display_current_image()
 
     def _delete_selected_annotation(self) -> None:
         """Delete the currently selected annotation (from keyboard)."""
+        # Make the canvas show the manager's current image first
+        self._flush_pending_nav()
         if not self.canvas or not self.canvas._selected_annotation_id:
             return
 
-        current_image = self.image_manager.get_current_image()
+        current_image = self.image_manager.current_image
         if not current_image:
             return
 
         annotation_id = self.canvas._selected_annotation_id
 
-        # Remove from managers
-        current_image.remove_annotation(annotation_id)
+        # Remove from managers and patch the views (dirty-rect canvas repaint);
+        # an ID from a view that showed another image matches nothing here
+        if not current_image.remove_annotation(annotation_id):
+            return
         self.annotation_manager.delete_annotation(annotation_id)
-
-        # Refresh display
-        self.canvas.set_annotations(current_image.annotations)
-        self.annotation_list.set_annotations(current_image.annotations)
-        self.status_bar.showMessage(
+        self.canvas.remove_annotation_item(annotation_id)
+        self.annotation_list.remove_annotation(annotation_id)
+        self._set_status_deferred(
             f"Deleted annotation ({len(current_image.annotations)} remaining)"
         )
 
+    @pyqtSlot(str)
     def _on_annotation_deleted_from_list(self, annotation_id: str) -> None:
         """
         Handle annotation deletion from annotation list widget.
@@ -606,21 +1077,63 @@ class MainWindow(QMainWindow):
         Args:
             annotation_id: ID of annotation to delete
         """
-        current_image = self.image_manager.get_current_image()
+        # Make the list show the manager's current image first
+        self._flush_pending_nav()
+        current_image = self.image_manager.current_image
         if not current_image:
             return
 
-        # Remove from managers
-        current_image.remove_annotation(annotation_id)
+        # Remove from managers and patch the views (dirty-rect canvas repaint);
+        # an ID from a view that showed another image matches nothing here
+        if not current_image.remove_annotation(annotation_id):
+            return
         self.annotation_manager.delete_annotation(annotation_id)
-
-        # Refresh display
-        self.canvas.set_annotations(current_image.annotations)
-        self.annotation_list.set_annotations(current_image.annotations)
-        self.status_bar.showMessage(
+        self.canvas.remove_annotation_item(annotation_id)
+        self.annotation_list.remove_annotation(annotation_id)
+        self._set_status_deferred(
             f"Deleted annotation ({len(current_image.annotations)} remaining)"
         )
 
+    def _set_status_deferred(self, message: str) -> None:
+        """
+        Show a status message once the current burst of updates settles.
+
+        Only the latest message of a burst is shown, STATUS_COALESCE_MS after
+        the first one was queued.
+
+        Args:
+            message: Status bar text
+        """
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _show_status(self, message: str) -> None:
+        """
+        Show a status message now, dropping any deferred one it supersedes.
+
+        Args:
+            message: Status bar text
+        """
+        self._status_timer.stop()
+        self._pending_status = None
+        self.status_bar.showMessage(message)
+
+    @pyqtSlot()
+    def _flush_status(self) -> None:
+        """Show the latest deferred status message."""
+        if self._pending_status is not None:
+            self.status_bar.showMessage(self._pending_status)
+            self._pending_status = None
+
+    def _refresh_annotations(self) -> None:
+        """Show the current image's annotations on the canvas and in the list."""
+        current_image = self.image_manager.current_image
+        if current_image:
+            self.canvas.set_annotations(current_image.annotations)
+            self.annotation_list.set_annotations(current_image.annotations)
+
+    @pyqtSlot(str)
     def _on_edit_label_requested(self, annotation_id: str) -> None:
         """
         Handle edit label request from annotation list widget.
@@ -630,6 +1143,10 @@ class MainWindow(QMainWindow):
         Args:
             annotation_id: ID of annotation to edit
         """
+        # Refresh below must target the image the list is showing
+        if self._flush_pending_nav():
+            return
+
         # Get current annotation
         annotation = self.annotation_manager.get_annotation(annotation_id)
         if not annotation:
@@ -656,15 +1173,13 @@ class MainWindow(QMainWindow):
 
                 if success:
                     # Refresh display
-                    current_image = self.image_manager.get_current_image()
-                    if current_image:
-                        self.canvas.set_annotations(current_image.annotations)
-                        self.annotation_list.set_annotations(current_image.annotations)
+                    self._refresh_annotations()
 
-                    self.status_bar.showMessage(
+                    self._show_status(
                         f"Updated label to: {new_label_id}: {new_label_name}"
                     )
 
+    @pyqtSlot()
     def export_annotations(self) -> None:
         """
         Export annotations to file.
@@ -680,12 +1195,9 @@ class MainWindow(QMainWindow):
             )
             return
 
-        # Get all images
-        images = self.image_manager.get_all_images()
-
-        # Check if there are any annotations
-        total_annotations = sum(len(img.annotations) for img in images)
-        if total_annotations == 0:
+        # Check if there are any annotations (every annotation shown in the
+        # UI is registered with the AnnotationManager, so this is O(1))
+        if self.annotation_manager.get_annotation_count() == 0:
             QMessageBox.warning(
                 self,
                 "No Annotations",
@@ -693,33 +1205,23 @@ class MainWindow(QMainWindow):
             )
             return
 
-        # Show export dialog
-        dialog = ExportDialog(self)
+        # Get all images
+        images = self.image_manager.get_all_images()
+
+        # Show export dialog (keeps the previous format and path)
+        if self._export_dialog is None:
+            self._export_dialog = ExportDialog(self)
+        dialog = self._export_dialog
         if not dialog.exec():
             return
 
-        export_format = dialog.get_export_format()
-        if not export_format:
+        config = dialog.get_export_config()
+        if not config:
             return
 
-        # Determine file extension and filter based on format
-        if export_format == "csv":
-            file_filter = "CSV Files (*.csv)"
-            default_ext = ".csv"
-        else:  # coco
-            file_filter = "JSON Files (*.json)"
-            default_ext = ".json"
-
-        # Show file save dialog
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export Annotations",
-            f"annotations{default_ext}",
-            file_filter
-        )
-
-        if not file_path:
-            return
+        # The dialog offers "CSV" and "COCO JSON" and has already chosen the path
+        export_format = "csv" if config['format'] == "CSV" else "coco"
+        file_path = config['path']
 
         # Check if file exists and warn user (Phase 6: overwrite protection)
         if Path(file_path).exists():
@@ -733,38 +1235,83 @@ class MainWindow(QMainWindow):
             )
 
             if reply == QMessageBox.StandardButton.No:
-                self.status_bar.showMessage("Export cancelled")
+                self._show_status("Export cancelled")
                 return
 
-        try:
-            # Export using the service
-            if export_format == "csv":
-                self.export_service.export_to_csv(images, file_path)
-            else:  # coco
-                self.export_service.export_to_coco(images, file_path)
+        # Export on a pool thread. The task reads the live annotation lists,
+        # so the modal progress dialog is shown before it starts and blocks
+        # edits until it finishes.
+        progress = QProgressDialog("Exporting annotations...", None, 0, 0, self)
+        progress.setWindowTitle("Export Annotations")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        # Stay open past the last row: the task still closes the file and
+        # reads the annotations for its statistics. The done/failed slots
+        # close the dialog.
+        progress.setAutoReset(False)
+        progress.setAutoClose(False)
+        if export_format == "csv":
+            # Only CSV export reports row progress; COCO shows a busy indicator
+            progress.setMaximum(self.annotation_manager.get_annotation_count())
+
+        task = _ExportTask(self.export_service, images, export_format, file_path)
+        task.signals.progress.connect(progress.setValue)
+        task.signals.done.connect(self._on_export_done)
+        task.signals.failed.connect(self._on_export_failed)
+
+        self._export_progress = progress
+        self._export_path = file_path
+        progress.show()
+        self._show_status("Exporting annotations...")
+        self._export_pool.start(task)
+
+    @pyqtSlot(dict)
+    def _on_export_done(self, stats: dict) -> None:
+        """
+        Report a finished background export.
 
-            # Get export statistics
-            stats = self.export_service.get_export_stats(images)
+        Args:
+            stats: Export statistics from ExportService.get_export_stats
+        """
+        file_path = self._export_path
+        self._close_export_progress()
 
-            # Show success message
-            QMessageBox.information(
-                self,
-                "Export Successful",
-                f"Exported {stats['total_annotations']} annotations "
-                f"from {stats['total_images']} images.\n\n"
-                f"File saved to:\n{file_path}"
-            )
+        # Show success message
+        QMessageBox.information(
+            self,
+            "Export Successful",
+            f"Exported {stats['total_annotations']} annotations "
+            f"from {stats['total_images']} images.\n\n"
+            f"File saved to:\n{file_path}"
+        )
 
-            self.status_bar.showMessage(
-                f"Exported {stats['total_annotations']} annotations to {file_path}"
-            )
+        self._show_status(
+            f"Exported {stats['total_annotations']} annotations to {file_path}"
+        )
 
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Export Failed",
-                f"Failed to export annotations:\n{str(e)}"
-            )
+    @pyqtSlot(str)
+    def _on_export_failed(self, message: str) -> None:
+        """
+        Report a failed background export.
+
+        Args:
+            message: Error description
+        """
+        self._close_export_progress()
+        QMessageBox.critical(
+            self,
+            "Export Failed",
+            f"Failed to export annotations:\n{message}"
+        )
+        self._show_status("Export failed")
+
+    def _close_export_progress(self) -> None:
+        """Dismiss the export progress dialog."""
+        if self._export_progress is not None:
+            self._export_progress.close()
+            self._export_progress.deleteLater()
+            self._export_progress = None
+        self._export_path = None
 
     def closeEvent(self, event):
         """
@@ -790,3 +1337,21 @@ class MainWindow(QMainWindow):
                 event.ignore()
         else:
             event.accept()
+
+        # Release cached dialogs once the window is really closing
+        if event.isAccepted():
+            # Stop a running subdirectory load before its thread is destroyed
+            if self._subdir_thread is not None:
+                self._subdir_worker.cancel()
+                self._subdir_thread.quit()
+                self._subdir_thread.wait()
+
+            # Let a running export finish writing its file
+            self._export_pool.waitForDone()
+
+            for dialog in (self._label_dialog, self._export_dialog, self._subdir_dialog):
+                if dialog is not None:
+                    dialog.deleteLater()
+            self._label_dialog = None
+            self._export_dialog = None
+            self._subdir_dialog = None
@@ -9,7 +9,7 @@ from PyQt6.QtWidgets import (
     QToolBar, QPushButton, QLabel, QWidget,
     QHBoxLayout, QButtonGroup, QToolButton
 )
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt
 from PyQt6.QtGui import QIcon
 
 
@@ -92,7 +92,7 @@ class ToolBar(QToolBar):
         self.draw_btn.setChecked(True)  # Default mode
         self.draw_btn.setToolTip("Draw new annotations (D)")
         self.draw_btn.setShortcut("D")
-        self.draw_btn.clicked.connect(lambda: self._on_mode_changed('draw'))
+        self.draw_btn.clicked.connect(self._on_draw_clicked)
         self.tool_group.addButton(self.draw_btn)
         self.addWidget(self.draw_btn)
 
@@ -102,7 +102,7 @@ class ToolBar(QToolBar):
         self.select_btn.setCheckable(True)
         self.select_btn.setToolTip("Select existing annotations (S)")
         self.select_btn.setShortcut("S")
-        self.select_btn.clicked.connect(lambda: self._on_mode_changed('select'))
+        self.select_btn.clicked.connect(self._on_select_clicked)
         self.tool_group.addButton(self.select_btn)
         self.addWidget(self.select_btn)
 
@@ -126,14 +126,27 @@ class ToolBar(QToolBar):
             self.prev_btn.setEnabled(False)
             self.next_btn.setEnabled(False)
 
+    @pyqtSlot()
     def _on_previous_clicked(self) -> None:
         """Handle Previous button click."""
         self.previous_image_requested.emit()
 
+    @pyqtSlot()
     def _on_next_clicked(self) -> None:
         """Handle Next button click."""
         self.next_image_requested.emit()
 
+    @pyqtSlot()
+    def _on_draw_clicked(self) -> None:
+        """Handle Draw button click."""
+        self._on_mode_changed('draw')
+
+    @pyqtSlot()
+    def _on_select_clicked(self) -> None:
+        """Handle Select button click."""
+        self._on_mode_changed('select')
+
+    @pyqtSlot(str)
     def _on_mode_changed(self, mode: str) -> None:
         """
         Handle mode change.
@@ -2,8 +2,11 @@
 Application-wide constants.
 """
 
-# Supported image formats
-SUPPORTED_FORMATS = ['.jpg', '.jpeg', '.png', '.bmp', '.gif']
+# Supported image formats (lowercase extensions; a frozenset for O(1) lookups)
+SUPPORTED_FORMATS: frozenset[str] = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.gif'})
+
+# QFileDialog name filter for the supported formats
+IMAGE_FILE_FILTER = "Images (" + " ".join(f"*{ext}" for ext in sorted(SUPPORTED_FORMATS)) + ")"
 
 # UI Colors (hex format for PyQt compatibility)
 DEFAULT_BOX_COLOR = '#00FF00'  # Green for normal annotations
@@ -17,3 +20,11 @@ LABEL_BACKGROUND_ALPHA = 180  # 0-255
 
 # Canvas settings
 MIN_BOX_SIZE = 5  # Minimum width/height for a valid bounding box
+RESIZE_SMOOTH_DELAY_MS = 50  # Idle time after a resize before smooth rescaling
+NAV_DEBOUNCE_MS = 40  # Key-repeat navigation displays only the image reached after this pause
+STATUS_COALESCE_MS = 30  # Hot-path status messages within this window are shown once
+ASYNC_SCALE_MIN_PIXELS = 16_000_000  # Images this large are smooth-scaled off the GUI thread
+
+# Cache settings
+IMAGE_CACHE_MAX_BYTES = 512 * 1024 * 1024  # Pixel memory budget for cached pixmaps
+PREFETCH_COUNT = 2  # Images decoded ahead in the current navigation direction